@@ -2,13 +2,14 @@
 
 import os
 from dataclasses import dataclass
+from functools import cache
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """MariaDB database configuration settings."""
     
@@ -56,5 +57,10 @@ class DatabaseConfig:
         return f"mysql+mariadb://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
-# Global config instance
-db_config = DatabaseConfig.from_env()
\ No newline at end of file
+@cache
+def get_db_config() -> DatabaseConfig:
+    """
+    Return the process-wide database configuration, read from the environment
+    on first use so importing this module never fails on missing variables.
+    """
+    return DatabaseConfig.from_env()
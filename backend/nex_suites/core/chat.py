@@ -1,14 +1,52 @@
+import re
+import time
+from typing import Optional
 from core.claude import Claude
 from mcp_client import MCPClient
 from core.tools import ToolManager
 from anthropic.types import MessageParam
 
+# Short greetings/acknowledgements that never need tools
+SIMPLE_MESSAGES = ('hi', 'hello', 'hey', 'thanks', 'thank you', 'bye', 'goodbye',
+                   'why', 'what', 'who', 'when', 'where', 'how', 'ok', 'okay', 'yes', 'no')
+
+# Keywords that indicate tool usage needed (matched anywhere in the query)
+TOOL_KEYWORDS = ('sales', 'invoice', 'revenue', 'august', 'september', 'month',
+                 'detail', 'show', 'get', 'list', 'report', 'data')
+
+# Compiled once: a query that is, or starts with, a simple message...
+_SIMPLE_RE = re.compile('(?:' + '|'.join(map(re.escape, SIMPLE_MESSAGES)) + ')(?: |$)')
+# ...and one scan for any tool keyword
+_TOOL_KEYWORD_RE = re.compile('|'.join(map(re.escape, TOOL_KEYWORDS)))
+
+# Tool lists are re-fetched from the servers at most this often
+TOOLS_CACHE_TTL = 30  # seconds
+
 
 class Chat:
     def __init__(self, claude_service: Claude, clients: dict[str, MCPClient]):
         self.claude_service: Claude = claude_service
         self.clients: dict[str, MCPClient] = clients
         self.messages: list[MessageParam] = []
+        self._tools_cache: Optional[list] = None
+        self._tools_cache_ts: float = 0
+        self._tools_cache_versions: tuple = ()
+
+    async def _tools(self) -> list:
+        """
+        All tools from all clients, cached for TOOLS_CACHE_TTL.
+        A tools/list_changed notification from any server drops the cache early.
+        """
+        versions = tuple(client.tools_version for client in self.clients.values())
+        if (
+            self._tools_cache is None
+            or versions != self._tools_cache_versions
+            or time.monotonic() - self._tools_cache_ts > TOOLS_CACHE_TTL
+        ):
+            self._tools_cache = await ToolManager.get_all_tools(self.clients)
+            self._tools_cache_ts = time.monotonic()
+            self._tools_cache_versions = versions
+        return self._tools_cache
 
     async def _process_query(self, query: str):
         self.messages.append({"role": "user", "content": query})
@@ -23,23 +61,18 @@ class Chat:
 
         # Check if the query needs tools
         query_lower = query.lower().strip()
-        simple_messages = ['hi', 'hello', 'hey', 'thanks', 'thank you', 'bye', 'goodbye', 
-                          'why', 'what', 'who', 'when', 'where', 'how', 'ok', 'okay', 'yes', 'no']
-        
+
         # Determine if we should include tools
         needs_tools = True
-        if len(query_lower) < 20 and any(query_lower == msg or query_lower.startswith(msg + ' ') for msg in simple_messages):
+        if len(query_lower) < 20 and _SIMPLE_RE.match(query_lower):
             needs_tools = False
-        
-        # Keywords that indicate tool usage needed
-        tool_keywords = ['sales', 'invoice', 'revenue', 'august', 'september', 'month', 
-                        'detail', 'show', 'get', 'list', 'report', 'data']
-        if any(keyword in query_lower for keyword in tool_keywords):
+
+        if _TOOL_KEYWORD_RE.search(query_lower):
             needs_tools = True
 
         while True:
             # Only get tools if needed
-            tools = await ToolManager.get_all_tools(self.clients) if needs_tools else None
+            tools = await self._tools() if needs_tools else None
             
             response = self.claude_service.chat(
                 messages=self.messages,
@@ -1,3 +1,4 @@
+import re
 from typing import List, Optional
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import Completer, Completion
@@ -13,6 +14,9 @@ from rich.panel import Panel
 
 from core.cli_chat import CliChat
 
+# Any of these means the response should be rendered as markdown
+_MARKDOWN_HINT_RE = re.compile(r"[#|]|```|\*\*|[-*] |1\. ")
+
 
 class CommandAutoSuggest(AutoSuggest):
     def __init__(self, prompts: List):
@@ -213,7 +217,7 @@ class CliApp:
                 self.console.print()  # Empty line for spacing
 
                 # Check if response contains markdown indicators
-                if any(indicator in response for indicator in ['#', '|', '```', '**', '##', '###', '- ', '* ', '1. ']):
+                if _MARKDOWN_HINT_RE.search(response):
                     # Render as rich markdown
                     self.console.print(Panel(
                         Markdown(response),
@@ -3,66 +3,247 @@ Centralized roots management for MCP file operations.
 Handles command-line argument parsing and root directory validation.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
-import argparse
+from typing import TYPE_CHECKING, Iterator, Optional, List, Tuple
+import logging
 import os
-from dotenv import load_dotenv
+import stat
+import sys
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    import argparse
+
+__all__ = ['RootsManager', 'resolve_root']
+
+
+# Verbosity (-v count) to logging level, and loggers silenced below -vv
+_VERBOSITY_LEVELS = (logging.ERROR, logging.WARNING, logging.INFO, logging.DEBUG)
+_QUIET_LOGGERS = tuple(logging.getLogger(name) for name in ("mcp", "utils.db"))
+
+# MCPClient logs server log notifications here; they print like the CLI's other output
+_SERVER_LOG = logging.getLogger("mcp.server")
+_SERVER_LOG_FORMAT = "  [%(levelname)s] %(message)s"
+
+
+def _split_roots(raw: str) -> tuple:
+    """Split a comma-separated roots string, skipping empty entries."""
+    return tuple(p.strip() for p in raw.split(",") if p.strip())
+
+
+# .env is loaded and DEFAULT_ROOTS parsed on first use;
+# use RootsManager.reload_env() after changing it
+_dotenv_loaded = False
+_DEFAULT_ROOTS_RAW: Optional[str] = None
+_DEFAULT_ROOTS_SPLIT: tuple = ()
+
+
+def _default_roots_env() -> Tuple[str, tuple]:
+    """Return DEFAULT_ROOTS as (raw value, split entries)."""
+    global _dotenv_loaded, _DEFAULT_ROOTS_RAW, _DEFAULT_ROOTS_SPLIT
+    if _DEFAULT_ROOTS_RAW is None:
+        if not _dotenv_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _dotenv_loaded = True
+        _DEFAULT_ROOTS_RAW = os.getenv("DEFAULT_ROOTS", "")
+        _DEFAULT_ROOTS_SPLIT = _split_roots(_DEFAULT_ROOTS_RAW)
+    return _DEFAULT_ROOTS_RAW, _DEFAULT_ROOTS_SPLIT
+
+
+@lru_cache(maxsize=256)
+def _resolve_cached(path_str: str) -> Path:
+    """Resolve a path string once; roots don't change during a run."""
+    return Path(path_str).resolve()
+
+
+def resolve_root(path_str: str) -> Path:
+    """Resolve a root path, skipping resolve() for absolute non-symlink paths."""
+    if os.path.isabs(path_str) and not os.path.islink(path_str):
+        return Path(path_str)
+    return _resolve_cached(path_str)
+
+
+@lru_cache(maxsize=1)
+def _home_str() -> str:
+    """Home directory as a string, looked up once per process."""
+    return str(Path.home())
+
+
+def _display(p: str) -> str:
+    """Shorten a path for display by replacing the home prefix with ~."""
+    home = _home_str()
+    return "~" + p[len(home):] if p.startswith(home) else p
+
+
+def _stat_is_dir(p) -> Optional[bool]:
+    """Single stat: None if missing, otherwise whether it is a directory."""
+    try:
+        return stat.S_ISDIR(os.stat(p).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _check_root(path_str: str) -> Optional[Path]:
+    """Resolve and stat one root path; returns None (with a warning) if unusable."""
+    path = resolve_root(path_str)
+
+    # Written straight to stderr: main.py raises the root logger to ERROR before
+    # setup_logging runs, so a logging warning here would never be shown
+    is_dir = _stat_is_dir(path)
+    if is_dir is None:
+        sys.stderr.write(f"Warning: Root path does not exist: {path_str}\n")
+        return None
+
+    if not is_dir:
+        sys.stderr.write(f"Warning: Root path is not a directory: {path_str}\n")
+        return None
+
+    return path
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the command-line parser for roots and other configs."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="MCP Chat with document conversion capabilities"
+    )
+
+    # Roots argument - now optional with smart defaults
+    parser.add_argument(
+        '--roots',
+        nargs='+',
+        type=str,
+        help='Root directories for file access (optional, uses common directories if not specified)',
+        default=None  # Changed from [] to None to detect when not provided
+    )
+
+    # Future extensibility
+    parser.add_argument(
+        '--model',
+        type=str,
+        help='Override Claude model from .env',
+        default=None
+    )
+
+    parser.add_argument(
+        '--servers',
+        nargs='+',
+        type=str,
+        help='Additional MCP servers to connect',
+        default=[]
+    )
+
+    # Logging control
+    parser.add_argument(
+        '--verbose', '-v',
+        action='count',
+        default=0,
+        help='Increase verbosity (-v, -vv, -vvv)'
+    )
+
+    return parser
+
+
+_PARSER: Optional["argparse.ArgumentParser"] = None
+
+
+def _get_parser() -> "argparse.ArgumentParser":
+    """Return the command-line parser, building it on first use."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
 
 
 class RootsManager:
     """Centralized roots management following Single Responsibility Principle."""
 
-    @staticmethod
-    def get_default_roots() -> List[str]:
-        """Get root directories from .env or use smart defaults."""
-        # First try loading from .env
-        env_roots = os.getenv("DEFAULT_ROOTS", "")
+    # Home-directory layout and .env don't change during a run - memoize
+    _cached_defaults: Optional[Tuple[List[str], str]] = None
+    _cached_smart_defaults: Optional[List[str]] = None
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Forget memoized default roots (used by tests)."""
+        cls._cached_defaults = None
+        cls._cached_smart_defaults = None
+
+    @classmethod
+    def reload_env(cls):
+        """Re-read DEFAULT_ROOTS from the environment and drop cached roots."""
+        global _DEFAULT_ROOTS_RAW
+        _DEFAULT_ROOTS_RAW = None
+        cls.invalidate_cache()
+
+    @classmethod
+    def get_default_roots(cls) -> Tuple[List[str], str]:
+        """
+        Get root directories from .env or use smart defaults.
+        Returns (roots, source) where source is "env" or "smart".
+        """
+        if cls._cached_defaults is None:
+            cls._cached_defaults = cls._load_default_roots()
+        roots, source = cls._cached_defaults
+        return list(roots), source
+
+    @classmethod
+    def _get_smart_defaults(cls) -> List[str]:
+        """Get sensible default root directories based on OS and what exists."""
+        if cls._cached_smart_defaults is None:
+            cls._cached_smart_defaults = cls._load_smart_defaults()
+        return list(cls._cached_smart_defaults)
 
-        if env_roots:
-            # Parse comma-separated paths from .env
+    @staticmethod
+    def _load_default_roots() -> Tuple[List[str], str]:
+        """Read DEFAULT_ROOTS from .env, falling back to smart defaults."""
+        # First try the comma-separated paths from .env
+        _, env_paths = _default_roots_env()
+        if env_paths:
             roots = []
-            for path in env_roots.split(","):
-                path = path.strip()
-                if path:  # Skip empty strings
-                    # Expand ~ to home directory and resolve path
-                    expanded = os.path.expanduser(path)
-                    resolved = Path(expanded).resolve()
-
-                    # Check if path exists and is a directory
-                    if resolved.exists() and resolved.is_dir():
-                        roots.append(str(resolved))
-                    else:
-                        print(f"Warning: Configured root '{path}' does not exist or is not a directory")
+            for path in env_paths:
+                # Expand ~ to home directory and normalize the string
+                normalized = os.path.normpath(os.path.expanduser(path))
+
+                # Check if path exists and is a directory
+                if _stat_is_dir(normalized):
+                    roots.append(os.path.abspath(normalized))
+                else:
+                    print(f"Warning: Configured root '{path}' does not exist or is not a directory")
 
             if roots:
-                return roots
+                return roots, "env"
             else:
                 print("Warning: No valid roots found in DEFAULT_ROOTS, falling back to smart defaults")
 
         # Fall back to smart defaults if .env not configured or no valid paths
-        return RootsManager._get_smart_defaults()
+        return RootsManager._get_smart_defaults(), "smart"
 
     @staticmethod
-    def _get_smart_defaults() -> List[str]:
-        """Get sensible default root directories based on OS and what exists."""
+    def _load_smart_defaults() -> List[str]:
+        """Probe common user directories that exist on this machine."""
         home = Path.home()
         defaults = []
 
-        # Common user directories - check if they exist
+        # Common user directories - one readdir of home instead of a stat each
         common_dirs = ['Downloads', 'Documents', 'Desktop']
+        found = {}
+        try:
+            with os.scandir(home) as entries:
+                for entry in entries:
+                    if entry.name in common_dirs and entry.is_dir():
+                        found[entry.name] = entry.path
+        except OSError:
+            pass
         for dir_name in common_dirs:
-            dir_path = home / dir_name
-            if dir_path.exists() and dir_path.is_dir():
-                defaults.append(str(dir_path))
+            if dir_name in found:
+                defaults.append(found[dir_name])
 
         # Add temp directory if it exists
-        if Path('/tmp').exists():
+        if _stat_is_dir('/tmp'):
             defaults.append('/tmp')
-        elif Path('/var/tmp').exists():
+        elif _stat_is_dir('/var/tmp'):
             defaults.append('/var/tmp')
 
         # If no defaults found, at least add home directory
@@ -72,117 +253,112 @@ class RootsManager:
         return defaults
 
     @staticmethod
-    def parse_arguments() -> argparse.Namespace:
+    def parse_arguments() -> "argparse.Namespace":
         """Parse command-line arguments for roots and other configs."""
-        parser = argparse.ArgumentParser(
-            description="MCP Chat with document conversion capabilities"
-        )
+        return RootsManager._parse(None, show_banner=True)
 
-        # Roots argument - now optional with smart defaults
-        parser.add_argument(
-            '--roots',
-            nargs='+',
-            type=str,
-            help='Root directories for file access (optional, uses common directories if not specified)',
-            default=None  # Changed from [] to None to detect when not provided
-        )
-
-        # Future extensibility
-        parser.add_argument(
-            '--model',
-            type=str,
-            help='Override Claude model from .env',
-            default=None
-        )
-
-        parser.add_argument(
-            '--servers',
-            nargs='+',
-            type=str,
-            help='Additional MCP servers to connect',
-            default=[]
-        )
-
-        # Logging control
-        parser.add_argument(
-            '--verbose', '-v',
-            action='count',
-            default=0,
-            help='Increase verbosity (-v, -vv, -vvv)'
-        )
+    @staticmethod
+    def parse_arguments_from_list(argv: List[str]) -> "argparse.Namespace":
+        """Parse an explicit argument list; the defaults banner only prints on a TTY."""
+        return RootsManager._parse(argv, show_banner=sys.stdout.isatty())
 
-        args = parser.parse_args()
+    @staticmethod
+    def _parse(argv: Optional[List[str]], show_banner: bool) -> "argparse.Namespace":
+        """Parse argv (sys.argv when None) and fill in default roots."""
+        args = _get_parser().parse_args(argv)
 
         # Apply defaults if no roots provided via command line
         if args.roots is None:
-            # Check if we're loading from .env
-            env_roots = os.getenv("DEFAULT_ROOTS", "")
-            args.roots = RootsManager.get_default_roots()
+            args.roots, source = RootsManager.get_default_roots()
+            from_env = source == "env"
+
+            if not show_banner:
+                return args
 
-            print("\n" + "="*60)
-            if env_roots:
-                print("No --roots specified. Using roots from .env:")
+            # Build the whole banner and write it in one call
+            lines = ["", "=" * 60]
+            if from_env:
+                lines.append("No --roots specified. Using roots from .env:")
             else:
-                print("No --roots specified. Using smart default directories:")
+                lines.append("No --roots specified. Using smart default directories:")
 
             for root in args.roots:
                 # Make paths more readable
-                display_path = root.replace(str(Path.home()), "~")
-                print(f"  • {display_path}")
-            print("="*60 + "\n")
+                lines.append(f"  • {_display(root)}")
+            lines += ["=" * 60, ""]
 
-            if env_roots:
-                print("To use different directories, edit DEFAULT_ROOTS in .env")
+            if from_env:
+                lines.append("To use different directories, edit DEFAULT_ROOTS in .env")
             else:
-                print("To configure defaults, add DEFAULT_ROOTS to .env file")
+                lines.append("To configure defaults, add DEFAULT_ROOTS to .env file")
 
-            print("Or restart with: python main.py --roots /your/path1 /your/path2")
-            print()
+            lines += ["Or restart with: python main.py --roots /your/path1 /your/path2", ""]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
 
         return args
 
+    @staticmethod
+    def iter_validate_roots(root_paths: List[str]) -> Iterator[Path]:
+        """Yield validated root paths one at a time, warning about invalid ones."""
+        for path_str in root_paths:
+            path = _check_root(path_str)
+            if path is not None:
+                yield path
+
     @staticmethod
     def validate_roots(root_paths: List[str]) -> List[Path]:
         """Validate and resolve root paths."""
-        validated_roots = []
-        show_details = len(root_paths) <= 3  # Only show details for custom roots
+        validated_roots = list(RootsManager.iter_validate_roots(root_paths))
+        RootsManager._report_validated(root_paths, validated_roots)
+        return validated_roots
 
-        for path_str in root_paths:
-            path = Path(path_str).resolve()
+    @staticmethod
+    async def validate_roots_async(root_paths: List[str]) -> List[Path]:
+        """Validate root paths concurrently in worker threads (slow network mounts)."""
+        import asyncio
 
-            if not path.exists():
-                print(f"Warning: Root path does not exist: {path_str}")
-                continue
+        checked = await asyncio.gather(
+            *(asyncio.to_thread(_check_root, path_str) for path_str in root_paths)
+        )
+        validated_roots = [path for path in checked if path is not None]
+        RootsManager._report_validated(root_paths, validated_roots)
+        return validated_roots
 
-            if not path.is_dir():
-                print(f"Warning: Root path is not a directory: {path_str}")
-                continue
+    @staticmethod
+    def _report_validated(root_paths: List[str], validated_roots: List[Path]):
+        """Print the outcome of root validation."""
+        show_details = len(root_paths) <= 3  # Only show details for custom roots
 
-            validated_roots.append(path)
-            if show_details:
-                display_path = str(path).replace(str(Path.home()), "~")
-                print(f"  ✓ Added root: {display_path}")
+        if show_details and validated_roots:
+            details = [f"  ✓ Added root: {_display(str(path))}" for path in validated_roots]
+            sys.stdout.write("\n".join(details) + "\n")
 
         if root_paths and not validated_roots:
             print("Warning: No valid root directories provided. File operations will be limited.")
 
-        return validated_roots
-
     @staticmethod
     def setup_logging(verbosity: int, existing_level: int = None):
         """Configure logging based on verbosity."""
-        import logging
-
         # Map verbosity to logging levels
-        levels = [logging.ERROR, logging.WARNING, logging.INFO, logging.DEBUG]
-        level = levels[min(verbosity, len(levels) - 1)]
+        level = _VERBOSITY_LEVELS[min(verbosity, len(_VERBOSITY_LEVELS) - 1)]
 
         # Only change if more verbose than existing
         if existing_level is None or level < existing_level:
-            logging.basicConfig(level=level)
+            # basicConfig is a no-op once the root logger has a handler, so
+            # set the level directly
+            logging.basicConfig()
+            logging.getLogger().setLevel(level)
 
             # Adjust specific loggers
             if verbosity < 2:
-                logging.getLogger("mcp").setLevel(logging.ERROR)
-                logging.getLogger("utils.db").setLevel(logging.ERROR)
-                logging.getLogger("mcp.server").setLevel(logging.ERROR)
\ No newline at end of file
+                for quiet_logger in _QUIET_LOGGERS:
+                    quiet_logger.setLevel(logging.ERROR)
+
+        # Server warnings and errors always show; info/debug progress from -vv
+        _SERVER_LOG.setLevel(level if verbosity >= 2 else logging.WARNING)
+        if not _SERVER_LOG.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter(_SERVER_LOG_FORMAT))
+            _SERVER_LOG.addHandler(handler)
+            _SERVER_LOG.propagate = False
\ No newline at end of file
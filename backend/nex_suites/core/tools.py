@@ -1,7 +1,7 @@
-import json
 from typing import Optional, Literal, List
 from mcp.types import CallToolResult, Tool, TextContent
 from mcp_client import MCPClient
+from utils.serialization import dumps
 from anthropic.types import Message, ToolResultBlockParam
 
 
@@ -85,7 +85,7 @@ class ToolManager:
                 content_list = [
                     item.text for item in items if isinstance(item, TextContent)
                 ]
-                content_json = json.dumps(content_list)
+                content_json = dumps(content_list)
                 tool_result_part = cls._build_tool_result_part(
                     tool_use_id,
                     content_json,
@@ -98,7 +98,7 @@ class ToolManager:
                 print(error_message)
                 tool_result_part = cls._build_tool_result_part(
                     tool_use_id,
-                    json.dumps({"error": error_message}),
+                    dumps({"error": error_message}),
                     "error"  # Always error if exception occurs
                 )
 
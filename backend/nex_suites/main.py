@@ -2,6 +2,7 @@ import asyncio
 import sys
 import os
 import logging
+from typing import List
 
 # Configure logging BEFORE importing other modules
 # Suppress all INFO logs except from our tools
@@ -35,12 +36,53 @@ assert anthropic_api_key, (
 )
 
 
+async def _serve_client(client: MCPClient, ready: asyncio.Future, stop: asyncio.Event):
+    """
+    Own one client's whole lifetime in a single task.
+    The stdio transport uses anyio task groups, which must be exited by the
+    task that entered them, so clients can't be entered from gather() and
+    closed later by the exit stack.
+    """
+    try:
+        async with client:
+            ready.set_result(client)
+            await stop.wait()
+    except BaseException as e:
+        if not ready.done():
+            ready.set_exception(e)
+            return
+        raise
+
+
+async def start_clients(stack: AsyncExitStack, clients: List[MCPClient]) -> None:
+    """Connect all clients concurrently; they are closed when stack exits."""
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    readies = [loop.create_future() for _ in clients]
+    tasks = [
+        asyncio.create_task(_serve_client(client, ready, stop))
+        for client, ready in zip(clients, readies)
+    ]
+
+    async def shutdown():
+        stop.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Mark failures that gather(*readies) did not surface as retrieved
+        for ready in readies:
+            if ready.done() and not ready.cancelled():
+                ready.exception()
+
+    stack.push_async_callback(shutdown)
+    # The first startup failure propagates; the exit stack then stops the rest
+    await asyncio.gather(*readies)
+
+
 async def main():
     # Parse ALL arguments in one place
     args = RootsManager.parse_arguments()
 
     # Validate roots (always present now due to defaults)
-    root_paths = RootsManager.validate_roots(args.roots)
+    root_paths = await RootsManager.validate_roots_async(args.roots)
     if root_paths:
         print(f"✓ Initialized with {len(root_paths)} root directories")
 
@@ -64,25 +106,31 @@ async def main():
         else ("python", ["mcp_server.py"])  # Use standard Python
     )
 
+    # Primary document server - provides document-related tools/resources/prompts
+    doc_client = MCPClient(
+        command=command,
+        args=mcp_args,
+        roots=[str(p) for p in root_paths]  # Pass roots to client
+    )
+    clients["doc_client"] = doc_client  # Special key for document operations
+
+    # Clients stay connected for the whole session; one per distinct server
+    # command, so a server listed twice is not spawned (or its tools listed) twice
+    spawned = {(command, tuple(mcp_args))}
+
+    # Additional MCP servers passed as command-line arguments
+    for i, server_script in enumerate(server_scripts):
+        server_key = ("uv", ("run", server_script))
+        if server_key in spawned:
+            continue
+        spawned.add(server_key)
+        client_id = f"client_{i}_{server_script}"  # Unique ID for each additional client
+        clients[client_id] = MCPClient(command="uv", args=["run", server_script])
+
     # AsyncExitStack ensures all clients are properly cleaned up on exit
     async with AsyncExitStack() as stack:
-        # Primary document server - provides document-related tools/resources/prompts
-        doc_client = await stack.enter_async_context(
-            MCPClient(
-                command=command,
-                args=mcp_args,
-                roots=[str(p) for p in root_paths]  # Pass roots to client
-            )
-        )
-        clients["doc_client"] = doc_client  # Special key for document operations
-
-        # Connect to additional MCP servers passed as command-line arguments
-        for i, server_script in enumerate(server_scripts):
-            client_id = f"client_{i}_{server_script}"  # Unique ID for each additional client
-            client = await stack.enter_async_context(
-                MCPClient(command="uv", args=["run", server_script])
-            )
-            clients[client_id] = client  # Add to clients dictionary
+        # Servers are independent, so spawn and handshake with all of them at once
+        await start_clients(stack, list(clients.values()))
 
         # Initialize chat system with document support (@ mentions, slash commands)
         chat = CliChat(
@@ -115,9 +163,10 @@ if __name__ == "__main__":
 #    - Initialize Claude service with API credentials
 #
 # 2. MCP SERVER CONNECTIONS:
-#    - Launch primary mcp_server.py subprocess (document server)
-#    - Connect doc_client via stdio transport (JSON-RPC 2.0)
-#    - Launch any additional MCP servers from command-line args
+#    - Build clients for the primary mcp_server.py (document server) and any
+#      additional MCP servers from command-line args, one per distinct command
+#    - start_clients() spawns and handshakes with all of them concurrently
+#      over stdio (JSON-RPC 2.0); startup takes as long as the slowest server
 #    - Store all clients in dictionary for tool aggregation
 #
 # 3. CHAT INITIALIZATION:
@@ -1,13 +1,55 @@
+import os
 import sys
 import asyncio
-from typing import Optional, Any, Callable, List
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Any, Callable, List
 from contextlib import AsyncExitStack
-from pathlib import Path
 from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client
 from mcp.types import LoggingMessageNotificationParams, Root, ListRootsResult, ErrorData
 from mcp.shared.context import RequestContext
-from pydantic import FileUrl
+
+from core.roots_manager import resolve_root
+
+if TYPE_CHECKING:
+    from pydantic import FileUrl
+
+
+@lru_cache(maxsize=128)
+def _file_url(path: str) -> "FileUrl":
+    """Build (and validate) a file:// URL once per root path."""
+    from pydantic import FileUrl
+
+    return FileUrl("file://" + path)
+
+
+# Server log notifications go through logging so the level check happens first
+_server_log = logging.getLogger("mcp.server")
+_LEVEL_MAP = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "notice": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "alert": logging.CRITICAL,
+    "emergency": logging.CRITICAL,
+}
+
+_PCT_FMT = "  [PROGRESS] {:.0f}/{:.0f} ({:.1f}%)".format
+
+
+async def _print_progress_callback(
+    progress: float, total: float | None, message: str | None
+):
+    """Display tool progress updates; shared by every call_tool invocation."""
+    if total is not None:
+        print(_PCT_FMT(progress, total, progress / total * 100))
+    else:
+        print(f"  [PROGRESS] {progress}")
+    if message:
+        print(f"  [PROGRESS] {message}")
 
 
 class MCPClient:
@@ -18,55 +60,70 @@ class MCPClient:
         env: Optional[dict] = None,
         roots: Optional[List[str]] = None,
     ):
-        self._command = command
-        self._args = args
-        self._env = env
+        self._server_params = StdioServerParameters(
+            command=command,
+            args=args,
+            env=env,
+        )
         self._roots = self._create_roots(roots) if roots else []
+        # Roots are fixed after construction, so the list_roots reply is too
+        self._roots_result = ListRootsResult(roots=self._roots)
         self._session: Optional[ClientSession] = None
         self._exit_stack: AsyncExitStack = AsyncExitStack()
+        # Bumped on notifications/tools/list_changed so callers can drop cached tool lists
+        self.tools_version = 0
+        # Server tools as of _tools_fetched_version; refetched once the version moves
+        self._tools: Optional[list[types.Tool]] = None
+        self._tools_fetched_version = -1
 
     def _create_roots(self, root_paths: List[str]) -> List[Root]:
         """Convert path strings to Root objects."""
         roots = []
         for path in root_paths:
-            p = Path(path).resolve()
-            file_url = FileUrl(f"file://{p}")
-            roots.append(Root(uri=file_url, name=p.name or "Root"))
+            resolved = str(resolve_root(path))
+            name = os.path.basename(resolved) or "Root"
+            roots.append(Root(uri=_file_url(resolved), name=name))
         return roots
 
     async def _handle_list_roots(
         self, context: RequestContext["ClientSession", None]
     ) -> ListRootsResult | ErrorData:
         """Callback for when server requests roots."""
-        return ListRootsResult(roots=self._roots)
+        return self._roots_result
+
+    async def _logging_callback(self, params: LoggingMessageNotificationParams):
+        """Callback for server log messages."""
+        # Check the level before touching the message
+        level = _LEVEL_MAP.get(getattr(params, 'level', 'info'), logging.INFO)
+        if not _server_log.isEnabledFor(level):
+            return
+        _server_log.log(level, "%s", getattr(params, 'data', params))
+
+    async def _message_handler(self, message: Any):
+        """Callback for server notifications not handled by ClientSession itself."""
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            self.tools_version += 1
 
     async def connect(self):
-        server_params = StdioServerParameters(
-            command=self._command,
-            args=self._args,
-            env=self._env,
-        )
-        
-        # Define logging callback to handle server log messages
-        async def logging_callback(params: LoggingMessageNotificationParams):
-            # Print log messages with appropriate prefix
-            level = params.level if hasattr(params, 'level') else 'info'
-            message = params.data if hasattr(params, 'data') else str(params)
-            print(f"  [{level.upper()}] {message}")
-        
         stdio_transport = await self._exit_stack.enter_async_context(
-            stdio_client(server_params)
+            stdio_client(self._server_params)
         )
         _stdio, _write = stdio_transport
         self._session = await self._exit_stack.enter_async_context(
             ClientSession(
                 _stdio,
                 _write,
-                logging_callback=logging_callback,
+                logging_callback=self._logging_callback,
+                message_handler=self._message_handler,
                 list_roots_callback=self._handle_list_roots if self._roots else None,
             )
         )
-        await self._session.initialize()
+        init_result = await self._session.initialize()
+        # Fetch the tool list during startup so the first chat turn needs no round-trip
+        if init_result.capabilities.tools:
+            await self.list_tools()
 
     def session(self) -> ClientSession:
         if self._session is None:
@@ -76,32 +133,26 @@ class MCPClient:
         return self._session
 
     async def list_tools(self) -> list[types.Tool]:
-        """Return a list of tools defined by the MCP server."""
-        result = await self.session().list_tools()
-        return result.tools
+        """
+        Return a list of tools defined by the MCP server.
+        Cached after the first request until the server sends tools/list_changed.
+        """
+        if self._tools is None or self._tools_fetched_version != self.tools_version:
+            # Read first, so a change notified during the request triggers another fetch
+            version = self.tools_version
+            result = await self.session().list_tools()
+            self._tools, self._tools_fetched_version = result.tools, version
+        return self._tools
 
     async def call_tool(
         self, tool_name: str, tool_input: dict
     ) -> types.CallToolResult | None:
         """Call a particular tool and return the result."""
-        
-        # Define progress callback to display progress updates
-        async def print_progress_callback(
-            progress: float, total: float | None, message: str | None
-        ):
-            if total is not None:
-                percentage = (progress / total) * 100
-                print(f"  [PROGRESS] {progress:.0f}/{total:.0f} ({percentage:.1f}%)")
-            else:
-                print(f"  [PROGRESS] {progress}")
-            if message:
-                print(f"  [PROGRESS] {message}")
-        
         # Call tool with progress callback for visual feedback
         result = await self.session().call_tool(
             tool_name, 
             tool_input,
-            progress_callback=print_progress_callback
+            progress_callback=_print_progress_callback
         )
         return result
 
@@ -120,6 +171,7 @@ class MCPClient:
     async def cleanup(self):
         await self._exit_stack.aclose()
         self._session = None
+        self._tools = None
 
     async def __aenter__(self):
         await self.connect()
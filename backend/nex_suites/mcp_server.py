@@ -1,223 +1,169 @@
-from mcp.server.fastmcp import FastMCP, Context
-from pydantic import Field
+from mcp.server.fastmcp import FastMCP
+from mcp.types import RootsListChangedNotification
+import asyncio
+import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from tools import sales, filesystem
+from tools.document_converter import DocumentConverter
 from resources import purchase
 from prompts import business_prompts
+from utils.db import close_shared_pool, init_shared_pool
 
 
-mcp = FastMCP("Nex Sales MCP", log_level="ERROR")
+# FastMCP enters the lifespan once per client session (one per connection
+# under SSE), but the pool and warm-up belong to the whole process
+_open_sessions = 0
+_warm_up_task: Optional["asyncio.Task[None]"] = None
 
 
+async def _warm_up() -> None:
+    # Resource queries then start on ready connections instead of each opening one
+    await init_shared_pool()
+    await purchase.warm_cache()
 
-################################################################
-##                        Define Tools                        ## 
-################################################################
 
-# Register the get_sales tool
-@mcp.tool(
-    name="get_sales",
-    description="Get sales/purchase order data for a specified time period"
-)
-async def get_sales(
-    period: str = Field(description="Time period (e.g., 'AUG', 'last 3 months', '2024', '6 months')"),
-    *,
-    context: Context
-) -> str:
-    """
-    Get sales/purchase order data for a specified period.
-    Returns formatted report with transaction details and summary.
+@asynccontextmanager
+async def lifespan(server: FastMCP):
     """
-    return await sales.get_sales(period, context=context)
-
-
-# Register the get_sales_detail tool
-@mcp.tool(
-    name="get_sales_detail",
-    description="Get detailed information about a specific sales invoice including customer info and line items"
-)
-async def get_sales_detail(
-    invoice_no: str = Field(description="Invoice number to retrieve details for (e.g., '2508000932', 'SI25080001')"),
-    *,
-    context: Context
-) -> str:
+    Open the shared database pool and warm the purchase resource cache in the
+    background when the first session starts, and close the pool (and the PDF
+    worker processes) once the last session ends.
     """
-    Get detailed information about a specific sales invoice.
-    Returns customer information and line items.
-    """
-    return await sales.get_sales_detail(invoice_no, context=context)
+    global _open_sessions, _warm_up_task
+    _open_sessions += 1
+    if _open_sessions == 1:
+        _warm_up_task = asyncio.create_task(_warm_up())
+    try:
+        yield {}
+    finally:
+        _open_sessions -= 1
+        if _open_sessions == 0:
+            _warm_up_task.cancel()
+            _warm_up_task = None
+            await close_shared_pool()
+            await asyncio.to_thread(DocumentConverter.shutdown_pdf_pool)
 
 
-################################################################
-##                      Define Resources                      ##
-################################################################
+mcp = FastMCP("Nex Sales MCP", log_level="ERROR", lifespan=lifespan)
 
-@mcp.resource("purchase://summary/month")
-async def purchase_summary_month_resource() -> str:
-    """
-    Current month's procurement summary for dashboard.
-    Returns total POs, spending, supplier count, and comparison with previous month.
-    """
-    return await purchase.purchase_summary_month()
 
 
-@mcp.resource("suppliers://top10")
-async def suppliers_top10_resource() -> str:
-    """
-    Top 10 suppliers by purchase volume.
-    Returns supplier details with total purchase amount and order count.
-    """
-    return await purchase.suppliers_top10()
+################################################################
+##                      Define Resources                      ##
+################################################################
 
+# (uri, callable). Names and descriptions come from each callable, so the
+# purchase functions are registered directly without wrappers.
+RESOURCES = [
+    ("purchase://summary/month", purchase.purchase_summary_month),
+    ("suppliers://top10", purchase.suppliers_top10),
+    ("purchase://pending-approval", purchase.purchase_pending_approval),
+]
 
-@mcp.resource("purchase://pending-approval")
-async def purchase_pending_approval_resource() -> str:
-    """
-    POs pending approval count and details.
-    Returns count, total value, and breakdown by urgency.
-    """
-    return await purchase.purchase_pending_approval()
+for uri, fn in RESOURCES:
+    mcp.resource(uri)(fn)
 
 
 ################################################################
-##                   Document Conversion Tools                ##
+##                        Define Tools                        ##
 ################################################################
 
-@mcp.tool(
-    name="convert_document",
-    description="Convert PDF/image to text, markdown, or JSON format with OCR support"
-)
-async def convert_document_tool(
-    input_path: str = Field(description="Path to PDF or image file"),
-    output_format: str = Field(
-        description="Output format: 'text', 'markdown', or 'json'",
-        default="markdown"
-    ),
-    *,
-    context: Context
-) -> str:
-    """
-    Convert document to specified format with OCR support.
-    Supports PDF, JPG, JPEG, and PNG files.
-    """
-    return await filesystem.convert_document(input_path, output_format, ctx=context)
+# Sales and filesystem tools need no wrapper; see the TOOLS table below
 
-
-@mcp.tool(
-    name="list_roots",
-    description="List all directories accessible to this server for file operations"
-)
-async def list_roots_tool(*, context: Context) -> List[str]:
-    """
-    List available root directories.
-    These are the directories where files can be read from.
-    """
-    return await filesystem.list_roots(context)
-
-
-@mcp.tool(
-    name="read_directory",
-    description="List files and subdirectories in a directory"
-)
-async def read_directory_tool(
-    path: str = Field(description="Directory path to read"),
-    *,
-    context: Context
-) -> List[Dict[str, Any]]:
-    """
-    Read directory contents. Path must be within allowed roots.
-    Returns list of files and directories with their properties.
-    """
-    return await filesystem.read_directory(path, ctx=context)
-
-
-@mcp.tool(
-    name="find_documents",
-    description="Find documents matching a pattern within allowed roots"
-)
-async def find_documents_tool(
-    pattern: str = Field(description="Search pattern (e.g., '*.pdf', 'invoice', 'receipt*')"),
-    root_path: Optional[str] = Field(None, description="Specific root to search in (optional)"),
-    *,
-    context: Context
-) -> List[Dict[str, Any]]:
+async def purchase_cache_invalidate_tool() -> str:
     """
-    Find documents matching a pattern.
-    Searches for PDFs and images that can be converted.
+    Invalidate the purchase resource cache.
+    Call after writing purchase data so resources reflect the change immediately.
     """
-    return await filesystem.find_documents(pattern, root_path, ctx=context)
-
-
-@mcp.tool(
-    name="save_conversion",
-    description="Convert document and save the result to a file"
-)
-async def save_conversion_tool(
-    input_path: str = Field(description="Path to source document"),
-    output_path: str = Field(description="Path where to save the converted file"),
-    output_format: str = Field(
-        description="Output format: 'text', 'markdown', or 'json'",
-        default="markdown"
-    ),
-    *,
-    context: Context
-) -> str:
-    """
-    Convert document and save to file.
-    Both paths must be within allowed roots.
-    """
-    return await filesystem.save_conversion(input_path, output_path, output_format, ctx=context)
+    purchase.invalidate_cache()
+    return "Purchase resource cache cleared"
 
 
 ################################################################
-##                      Define Prompts                        ##
+##                      Register Tools                        ##
 ################################################################
 
-@mcp.prompt(
-    name="generate_purchase_report",
-    description="Generate comprehensive monthly purchase report with insights and recommendations"
-)
-async def generate_purchase_report_prompt(
-    month: Optional[str] = Field(None, description="Month name (e.g., 'January'). Defaults to current month.")
-) -> List[Dict[str, Any]]:
-    """
-    Generate a comprehensive purchase report for the specified month.
-    Includes financial overview, supplier analysis, and optimization opportunities.
-    """
-    return await business_prompts.generate_purchase_report_prompt(month)
+# (name, description, callable). Parameter schemas come from each callable's
+# annotations, so module functions are registered directly without wrappers.
+TOOLS = [
+    ("get_sales",
+     "Get sales/purchase order data for a specified time period",
+     sales.get_sales),
+    ("get_sales_detail",
+     "Get detailed information about a specific sales invoice including customer info and line items",
+     sales.get_sales_detail),
+    ("purchase_cache_invalidate",
+     "Clear cached purchase resources so the next read fetches fresh data",
+     purchase_cache_invalidate_tool),
+    ("convert_document",
+     "Convert PDF/image to text, markdown, or JSON format with OCR support",
+     filesystem.convert_document),
+    ("convert_document_formats",
+     "Convert PDF/image to several of text, markdown, and JSON at once, running OCR only once",
+     filesystem.convert_document_formats),
+    ("convert_documents",
+     "Convert several PDF/image files to text, markdown, or JSON format in a single call",
+     filesystem.convert_documents),
+    ("list_roots",
+     "List all directories accessible to this server for file operations",
+     filesystem.list_roots),
+    ("read_directory",
+     "List files and subdirectories in a directory",
+     filesystem.read_directory),
+    ("find_documents",
+     "Find documents matching a pattern within allowed roots",
+     filesystem.find_documents),
+    ("fs_batch",
+     "Run several list_roots/read_directory/find_documents operations in a single call",
+     filesystem.fs_batch),
+    ("save_conversion",
+     "Convert document and save the result to a file",
+     filesystem.save_conversion),
+]
+
+for name, description, fn in TOOLS:
+    mcp.add_tool(fn, name=name, description=description)
+
+# FastMCP has no decorator for client notifications; drop cached roots when they change
+mcp._mcp_server.notification_handlers[RootsListChangedNotification] = filesystem.invalidate_roots_cache
 
 
-@mcp.prompt(
-    name="analyze_supplier_performance",
-    description="Analyze supplier performance metrics and provide improvement recommendations"
-)
-async def analyze_supplier_performance_prompt(
-    supplier_id: Optional[str] = Field(None, description="Specific supplier ID to analyze. Analyzes top 10 if not specified.")
-) -> List[Dict[str, Any]]:
-    """
-    Conduct comprehensive supplier performance analysis.
-    Evaluates reliability, pricing, quality, and provides strategic recommendations.
-    """
-    return await business_prompts.analyze_supplier_performance_prompt(supplier_id)
+################################################################
+##                      Define Prompts                        ##
+################################################################
 
+# (name, description, callable). Argument descriptions come from each
+# callable's annotations, as for TOOLS.
+PROMPTS = [
+    ("generate_purchase_report",
+     "Generate comprehensive monthly purchase report with insights and recommendations",
+     business_prompts.generate_purchase_report_prompt),
+    ("analyze_supplier_performance",
+     "Analyze supplier performance metrics and provide improvement recommendations",
+     business_prompts.analyze_supplier_performance_prompt),
+    ("optimize_procurement",
+     "Generate procurement optimization suggestions and cost-saving opportunities",
+     business_prompts.optimize_procurement_prompt),
+]
 
-@mcp.prompt(
-    name="optimize_procurement",
-    description="Generate procurement optimization suggestions and cost-saving opportunities"
-)
-async def optimize_procurement_prompt() -> List[Dict[str, Any]]:
-    """
-    Perform procurement optimization analysis to identify cost savings.
-    Includes bulk purchase opportunities, supplier consolidation, and process improvements.
-    """
-    return await business_prompts.optimize_procurement_prompt()
+for name, description, fn in PROMPTS:
+    mcp.prompt(name=name, description=description)(fn)
 
 
 if __name__ == "__main__":
-    mcp.run(transport="stdio")
+    # uvloop is optional; fall back to the stdlib event loop when it is not installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    # MCP_TRANSPORT=sse serves many clients concurrently over HTTP instead of one stdio pipe
+    mcp.run(transport=os.getenv("MCP_TRANSPORT", "stdio"))
@@ -0,0 +1,22 @@
+-- Indexes for the purchase resources in resources/purchase.py.
+--
+-- purchase_summary_month and suppliers_top10 filter tbl_purchase_order on an
+-- OrderDate_dd range and read only SupplierId_i, TotalAmount_d and the primary
+-- key, so idx_po_orderdate_supp covers both queries (InnoDB secondary indexes
+-- carry the primary key). purchase_pending_approval filters on
+-- ApprovalStatus_c and reads TotalAmount_d and OrderDate_dd.
+--
+-- Check the plans afterwards, e.g.:
+--   EXPLAIN SELECT COALESCE(SUM(TotalAmount_d), 0) FROM tbl_purchase_order
+--   WHERE OrderDate_dd >= '2026-01-01' AND OrderDate_dd <= '2026-12-31';
+-- should show key = idx_po_orderdate_supp and "Using index".
+--
+-- Note: the pending-approval filter also matches UPPER(ApprovalStatus_c), so
+-- MariaDB scans idx_po_approval instead of seeking into it; the scan still
+-- reads the narrow index rather than the whole table.
+
+CREATE INDEX IF NOT EXISTS idx_po_orderdate_supp
+    ON tbl_purchase_order (OrderDate_dd, SupplierId_i, TotalAmount_d);
+
+CREATE INDEX IF NOT EXISTS idx_po_approval
+    ON tbl_purchase_order (ApprovalStatus_c, TotalAmount_d, OrderDate_dd);
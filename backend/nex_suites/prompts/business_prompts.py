@@ -1,27 +1,20 @@
 """Business prompts for MCP server - Purchase and Procurement focused."""
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-
-logger = logging.getLogger(__name__)
+from functools import lru_cache
+from typing import Annotated, Optional, List, Dict, Any
 
+from pydantic import Field
 
-async def generate_purchase_report_prompt(month: Optional[str] = None) -> List[Dict[str, Any]]:
-    """
-    Generate a comprehensive purchase report prompt for the specified month.
+from resources import purchase
 
-    Args:
-        month: Optional month name (e.g., "January", "December").
-               Defaults to current month if not specified.
+logger = logging.getLogger(__name__)
 
-    Returns:
-        List containing the user message for Claude to generate the report.
-    """
-    target_month = month or datetime.now().strftime("%B")
-    current_year = datetime.now().year
+# Prompt bodies are static apart from a few fields, so build them once at import
 
-    prompt_content = f"""Generate a comprehensive purchase report for {target_month} {current_year}.
+_REPORT_TEMPLATE = """Generate a comprehensive purchase report for {month} {year}.
 
 Please follow these steps:
 
@@ -34,7 +27,7 @@ Please follow these steps:
 2. **Report Structure**:
 
    📊 **EXECUTIVE SUMMARY**
-   - Total procurement spend for {target_month}
+   - Total procurement spend for {month}
    - Number of purchase orders processed
    - Key achievements and concerns (3-4 bullet points)
 
@@ -73,31 +66,22 @@ Please follow these steps:
 
 Please ensure the report is data-driven, actionable, and formatted for executive presentation."""
 
-    return [{
-        "role": "user",
-        "content": prompt_content
-    }]
+_REPORT_DATA_TEMPLATE = """
 
+**Pre-fetched resource data** (current as of this prompt; use it instead of re-reading the resources below):
 
-async def analyze_supplier_performance_prompt(supplier_id: Optional[str] = None) -> List[Dict[str, Any]]:
-    """
-    Analyze supplier performance metrics and provide recommendations.
+{sections}"""
 
-    Args:
-        supplier_id: Optional specific supplier ID to analyze.
-                    If not provided, analyzes all top suppliers.
+# English month names, independent of the process locale
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
 
-    Returns:
-        List containing the user message for supplier performance analysis.
-    """
-    if supplier_id:
-        analysis_target = f"supplier ID {supplier_id}"
-        instruction = f"Focus the analysis on supplier with ID: {supplier_id}"
-    else:
-        analysis_target = "top 10 suppliers"
-        instruction = "Analyze the top 10 suppliers from the suppliers://top10 resource"
+# A resource that fails or takes longer than this is marked unavailable
+_PREFETCH_TIMEOUT = 10.0
 
-    prompt_content = f"""Conduct a comprehensive supplier performance analysis for {analysis_target}.
+_SUPPLIER_TEMPLATE = """Conduct a comprehensive supplier performance analysis for {analysis_target}.
 
 **Analysis Framework**:
 
@@ -161,20 +145,7 @@ async def analyze_supplier_performance_prompt(supplier_id: Optional[str] = None)
 
 Please provide data-driven insights with specific examples and actionable recommendations."""
 
-    return [{
-        "role": "user",
-        "content": prompt_content
-    }]
-
-
-async def optimize_procurement_prompt() -> List[Dict[str, Any]]:
-    """
-    Generate procurement optimization suggestions based on current data.
-
-    Returns:
-        List containing the user message for procurement optimization analysis.
-    """
-    prompt_content = """Perform a comprehensive procurement optimization analysis and provide cost-saving recommendations.
+_OPTIMIZE_TEMPLATE = """Perform a comprehensive procurement optimization analysis and provide cost-saving recommendations.
 
 **Optimization Analysis Framework**:
 
@@ -257,7 +228,109 @@ async def optimize_procurement_prompt() -> List[Dict[str, Any]]:
 
 Please provide specific, data-backed recommendations with clear implementation steps and measurable outcomes."""
 
+
+@lru_cache(maxsize=32)
+def _build_report(month: str, year: int) -> str:
+    """Render the purchase report prompt for one month/year."""
+    return _REPORT_TEMPLATE.format(month=month, year=year)
+
+
+@lru_cache(maxsize=128)
+def _build_supplier_analysis(supplier_id: Optional[str]) -> str:
+    """Render the supplier performance prompt for one supplier (or all)."""
+    if supplier_id:
+        analysis_target = f"supplier ID {supplier_id}"
+        instruction = f"Focus the analysis on supplier with ID: {supplier_id}"
+    else:
+        analysis_target = "top 10 suppliers"
+        instruction = "Analyze the top 10 suppliers from the suppliers://top10 resource"
+
+    return _SUPPLIER_TEMPLATE.format(
+        analysis_target=analysis_target,
+        instruction=instruction
+    )
+
+
+async def _prefetch_report_data(include_summary: bool) -> str:
+    """
+    Fetch the report's purchase resources concurrently.
+    purchase://summary/month only covers the current month, so it is left
+    out (and read by the model as instructed) for reports on other months.
+    """
+    resources = {
+        "suppliers://top10": purchase.suppliers_top10,
+        "purchase://pending-approval": purchase.purchase_pending_approval,
+    }
+    if include_summary:
+        resources = {"purchase://summary/month": purchase.purchase_summary_month, **resources}
+
+    results = await asyncio.gather(
+        *(asyncio.wait_for(fetch(), _PREFETCH_TIMEOUT) for fetch in resources.values()),
+        return_exceptions=True
+    )
+    sections = []
+    for uri, result in zip(resources, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Report resource pre-fetch failed: {result!r}")
+            result = "[unavailable]"
+        sections.append(f"{uri}:\n{result}")
+
+    return _REPORT_DATA_TEMPLATE.format(sections="\n\n".join(sections))
+
+
+async def generate_purchase_report_prompt(
+    month: Annotated[Optional[str], Field(description="Month name (e.g., 'January'). Defaults to current month.")] = None
+) -> List[Dict[str, Any]]:
+    """
+    Generate a comprehensive purchase report prompt for the specified month.
+
+    Args:
+        month: Optional month name (e.g., "January", "December").
+               Defaults to current month if not specified.
+
+    Returns:
+        List containing the user message for Claude to generate the report.
+    """
+    now = datetime.now()
+    current_month = _MONTH_NAMES[now.month - 1]
+    target_month = month or current_month
+    current_year = now.year
+
+    data_section = await _prefetch_report_data(target_month.casefold() == current_month.casefold())
+
+    return [{
+        "role": "user",
+        "content": _build_report(target_month, current_year) + data_section
+    }]
+
+
+def analyze_supplier_performance_prompt(
+    supplier_id: Annotated[Optional[str], Field(description="Specific supplier ID to analyze. Analyzes top 10 if not specified.")] = None
+) -> List[Dict[str, Any]]:
+    """
+    Analyze supplier performance metrics and provide recommendations.
+
+    Args:
+        supplier_id: Optional specific supplier ID to analyze.
+                    If not provided, analyzes all top suppliers.
+
+    Returns:
+        List containing the user message for supplier performance analysis.
+    """
+    return [{
+        "role": "user",
+        "content": _build_supplier_analysis(supplier_id)
+    }]
+
+
+def optimize_procurement_prompt() -> List[Dict[str, Any]]:
+    """
+    Generate procurement optimization suggestions based on current data.
+
+    Returns:
+        List containing the user message for procurement optimization analysis.
+    """
     return [{
         "role": "user",
-        "content": prompt_content
+        "content": _OPTIMIZE_TEMPLATE
     }]
\ No newline at end of file
@@ -3,36 +3,18 @@ Sales-related prompt handlers
 Tool-bound prompts for accurate data processing
 """
 
+from string import Template
+
 from mcp.server.fastmcp import Context
 
+from utils.serialization import dumps
 
-async def format_sales_invoice(
-    invoice_id: str,
-    context: Context
-) -> list:
-    """
-    Tool-bound prompt that formats sales invoice data.
-    Must execute get_sales_detail tool first to get accurate data.
-    """
-    
-    # Execute bound tool to get invoice data
-    try:
-        invoice_data = await context.call_tool(
-            "get_sales_detail", 
-            {"invoice_no": invoice_id}
-        )
-    except Exception as e:
-        return [{
-            "role": "user",
-            "content": f"Error retrieving invoice {invoice_id}: {str(e)}. Please check the invoice number and try again."
-        }]
-    
-    # Load template (simplified for now - would use loader in production)
-    prompt_template = """
+# "$" placeholders leave any "{" in the tool output untouched
+_INVOICE_TPL = Template("""
 You are a sales data formatting specialist. Display sales invoice result in tabular form. limit to 20 rows.
 
 Given the following invoice data:
-{data}
+$data
 
 Please format this information as follows:
 
@@ -58,43 +40,13 @@ Please format this information as follows:
      * Any notable aspects of the transaction
 
 Format everything using clean markdown. Ensure numbers are properly formatted with currency symbols where appropriate.
-"""
-    
-    # Replace data placeholder
-    final_prompt = prompt_template.replace("{data}", str(invoice_data))
-    
-    return [{
-        "role": "user",
-        "content": final_prompt
-    }]
-
+""")
 
-async def analyze_sales_trends(
-    period: str,
-    context: Context
-) -> list:
-    """
-    Analyzes sales data trends for the specified period.
-    Tool-bound to get_sales for accurate data retrieval.
-    """
-    
-    # Execute bound tool to get sales data
-    try:
-        sales_data = await context.call_tool(
-            "get_sales",
-            {"period": period}
-        )
-    except Exception as e:
-        return [{
-            "role": "user",
-            "content": f"Error retrieving sales data for {period}: {str(e)}. Please check the period format and try again."
-        }]
-    
-    prompt_template = """
+_TRENDS_TPL = Template("""
 You are a sales analytics expert.
 
-Analyze the following sales data for the period: {period}
-{data}
+Analyze the following sales data for the period: $period
+$data
 Display sales invoice result in tabular form. limit to 20 rows.
 
 Provide a comprehensive analysis including:
@@ -121,9 +73,80 @@ Provide a comprehensive analysis including:
    - Opportunities to explore
 
 Present findings in a clear, structured format using markdown.
-"""
+""")
+
+_SUMMARY_TPL = Template("""
+Create an executive summary of the following sales data for $period:
+$data
+Display sales invoice result in tabular form. limit to 20 rows.
+Summary Requirements:
+- Start with a one-sentence overview
+- Include total sales value and transaction count
+- Highlight top 3 performing items
+- Note any significant patterns
+- Keep total length under 200 words
+- Use bullet points for clarity
+
+Focus on actionable insights for management review.
+""")
+
+
+def _tool_data(result) -> str:
+    """Render a tool result as compact JSON rather than a Python repr."""
+    return dumps(getattr(result, "content", result))
+
+
+async def format_sales_invoice(
+    invoice_id: str,
+    context: Context
+) -> list:
+    """
+    Tool-bound prompt that formats sales invoice data.
+    Must execute get_sales_detail tool first to get accurate data.
+    """
+    
+    # Execute bound tool to get invoice data
+    try:
+        invoice_data = await context.call_tool(
+            "get_sales_detail", 
+            {"invoice_no": invoice_id}
+        )
+    except Exception as e:
+        return [{
+            "role": "user",
+            "content": f"Error retrieving invoice {invoice_id}: {str(e)}. Please check the invoice number and try again."
+        }]
     
-    final_prompt = prompt_template.replace("{period}", period).replace("{data}", str(sales_data))
+    final_prompt = _INVOICE_TPL.substitute(data=_tool_data(invoice_data))
+    
+    return [{
+        "role": "user",
+        "content": final_prompt
+    }]
+
+
+async def analyze_sales_trends(
+    period: str,
+    context: Context
+) -> list:
+    """
+    Analyzes sales data trends for the specified period.
+    Tool-bound to get_sales for accurate data retrieval.
+    """
+    
+    # Execute bound tool to get sales data
+    try:
+        sales_data = await context.call_tool(
+            "get_sales",
+            {"period": period}
+        )
+    except Exception as e:
+        return [{
+            "role": "user",
+            "content": f"Error retrieving sales data for {period}: {str(e)}. Please check the period format and try again."
+        }]
+    
+    final_prompt = _TRENDS_TPL.substitute(period=period, data=_tool_data(sales_data))
     
     return [{
         "role": "user",
@@ -152,22 +175,7 @@ async def summarize_sales_data(
             "content": f"Error retrieving sales data: {str(e)}"
         }]
     
-    prompt_template = """
-Create an executive summary of the following sales data for {period}:
-{data}
-Display sales invoice result in tabular form. limit to 20 rows.
-Summary Requirements:
-- Start with a one-sentence overview
-- Include total sales value and transaction count
-- Highlight top 3 performing items
-- Note any significant patterns
-- Keep total length under 200 words
-- Use bullet points for clarity
-
-Focus on actionable insights for management review.
-"""
-    
-    final_prompt = prompt_template.replace("{period}", period).replace("{data}", str(sales_data))
+    final_prompt = _SUMMARY_TPL.substitute(period=period, data=_tool_data(sales_data))
     
     return [{
         "role": "user",
@@ -1,6 +1,6 @@
 """Purchase management resources for MCP server."""
 
-import json
+import asyncio
 import logging
 import sys
 from datetime import datetime, timedelta
@@ -10,57 +10,83 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from utils.cache import async_ttl_cache
 from utils.db import get_db_connection
+from utils.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
+# Cache lifetimes (seconds); the top-10 ranking moves slowest
+SUMMARY_TTL = 300
+TOP_SUPPLIERS_TTL = 900
+PENDING_APPROVAL_TTL = 300
+
+
+def _is_ok(payload: str) -> bool:
+    """Error payloads are not cached so the next read retries the query."""
+    # dumps() output is compact, so an error payload always starts this way
+    return not payload.startswith('{"error"')
+
 
 async def purchase_summary_month() -> str:
     """
     Current month's procurement summary for dashboard.
     Returns total POs, spending, supplier count, and comparison with previous month.
     """
+    now = datetime.now()
+    return await _purchase_summary_for(now.year, now.month)
+
+
+@async_ttl_cache(ttl=SUMMARY_TTL, cache_if=_is_ok)
+async def _purchase_summary_for(year: int, month: int) -> str:
+    """
+    Summary for the given (current) month. The month is part of the cache
+    key, so a cached summary is never served after the month rolls over.
+    """
     try:
         async with get_db_connection() as db:
             now = datetime.now()
-            current_month_start = datetime(now.year, now.month, 1)
+            current_month_start = datetime(year, month, 1)
 
             # Calculate previous month dates
-            if now.month == 1:
-                prev_month_start = datetime(now.year - 1, 12, 1)
-                prev_month_end = datetime(now.year, 1, 1) - timedelta(seconds=1)
+            if month == 1:
+                prev_month_start = datetime(year - 1, 12, 1)
+                prev_month_end = datetime(year, 1, 1) - timedelta(seconds=1)
             else:
-                prev_month_start = datetime(now.year, now.month - 1, 1)
+                prev_month_start = datetime(year, month - 1, 1)
                 prev_month_end = current_month_start - timedelta(seconds=1)
 
-            # Current month query
-            current_query = """
+            # Both months in one round-trip; each bucket is picked out with CASE.
+            # PurchaseOrderId_i is the primary key, so rows need no DISTINCT to count POs
+            query = """
                 SELECT
-                    COUNT(DISTINCT PurchaseOrderId_i) as po_count,
-                    COUNT(DISTINCT SupplierId_i) as supplier_count,
-                    COALESCE(SUM(TotalAmount_d), 0) as total_amount
+                    COUNT(CASE WHEN OrderDate_dd >= %s THEN 1 END) as po_count,
+                    COUNT(DISTINCT CASE WHEN OrderDate_dd >= %s THEN SupplierId_i END) as supplier_count,
+                    COALESCE(SUM(CASE WHEN OrderDate_dd >= %s THEN TotalAmount_d END), 0) as total_amount,
+                    COALESCE(SUM(CASE WHEN OrderDate_dd < %s THEN TotalAmount_d END), 0) as prev_total_amount
                 FROM tbl_purchase_order
                 WHERE OrderDate_dd >= %s AND OrderDate_dd < %s
             """
 
-            current_result = await db.fetch_one(current_query, (current_month_start, now))
-
-            # Previous month query
-            prev_result = await db.fetch_one(current_query, (prev_month_start, prev_month_end))
+            result = await db.fetch_one(query, (
+                current_month_start, current_month_start, current_month_start,
+                prev_month_end,
+                prev_month_start, now
+            ))
 
             # Calculate percentage changes
-            prev_total = float(prev_result['total_amount']) if prev_result and prev_result['total_amount'] else 0
-            current_total = float(current_result['total_amount']) if current_result and current_result['total_amount'] else 0
+            prev_total = float(result['prev_total_amount']) if result and result['prev_total_amount'] else 0
+            current_total = float(result['total_amount']) if result and result['total_amount'] else 0
 
             if prev_total > 0:
                 change_percentage = ((current_total - prev_total) / prev_total) * 100
             else:
                 change_percentage = 100 if current_total > 0 else 0
 
-            return json.dumps({
-                "month": now.strftime("%B %Y"),
-                "po_count": int(current_result['po_count']) if current_result else 0,
-                "supplier_count": int(current_result['supplier_count']) if current_result else 0,
+            return dumps({
+                "month": current_month_start.strftime("%B %Y"),
+                "po_count": int(result['po_count']) if result else 0,
+                "supplier_count": int(result['supplier_count']) if result else 0,
                 "total_amount": current_total,
                 "currency": "RM",
                 "change_from_last_month": round(change_percentage, 2),
@@ -69,9 +95,10 @@ async def purchase_summary_month() -> str:
 
     except Exception as e:
         logger.exception("Failed to fetch purchase summary")
-        return json.dumps({"error": f"Failed to fetch purchase summary: {str(e)}"})
+        return dumps({"error": f"Failed to fetch purchase summary: {str(e)}"})
 
 
+@async_ttl_cache(ttl=TOP_SUPPLIERS_TTL, cache_if=_is_ok)
 async def suppliers_top10() -> str:
     """
     Top 10 suppliers by purchase volume.
@@ -99,8 +126,6 @@ async def suppliers_top10() -> str:
                 LIMIT 10
             """
 
-            results = await db.fetch_all(query, (start_date, end_date))
-
             # Calculate total spending for percentage
             total_query = """
                 SELECT COALESCE(SUM(TotalAmount_d), 0) as grand_total
@@ -108,7 +133,11 @@ async def suppliers_top10() -> str:
                 WHERE OrderDate_dd >= %s AND OrderDate_dd <= %s
             """
 
-            total_result = await db.fetch_one(total_query, (start_date, end_date))
+            # Independent queries; pooled, so each runs on its own connection
+            results, total_result = await asyncio.gather(
+                db.fetch_all(query, (start_date, end_date)),
+                db.fetch_one(total_query, (start_date, end_date))
+            )
             grand_total = float(total_result['grand_total']) if total_result and total_result['grand_total'] else 0
 
             suppliers = []
@@ -127,7 +156,7 @@ async def suppliers_top10() -> str:
                     "percentage_of_total": round(percentage, 2)
                 })
 
-            return json.dumps({
+            return dumps({
                 "period": f"{start_date.strftime('%b %Y')} - {end_date.strftime('%b %Y')}",
                 "suppliers": suppliers,
                 "grand_total": grand_total,
@@ -136,9 +165,10 @@ async def suppliers_top10() -> str:
 
     except Exception as e:
         logger.exception("Failed to fetch top suppliers")
-        return json.dumps({"error": f"Failed to fetch top suppliers: {str(e)}"})
+        return dumps({"error": f"Failed to fetch top suppliers: {str(e)}"})
 
 
+@async_ttl_cache(ttl=PENDING_APPROVAL_TTL, cache_if=_is_ok)
 async def purchase_pending_approval() -> str:
     """
     POs pending approval count and details.
@@ -159,8 +189,6 @@ async def purchase_pending_approval() -> str:
                    OR UPPER(ApprovalStatus_c) = 'WAITING'
             """
 
-            result = await db.fetch_one(query)
-
             # Breakdown by amount ranges (urgency levels)
             breakdown_query = """
                 SELECT
@@ -186,7 +214,10 @@ async def purchase_pending_approval() -> str:
                     END
             """
 
-            breakdown = await db.fetch_all(breakdown_query)
+            result, breakdown = await asyncio.gather(
+                db.fetch_one(query),
+                db.fetch_all(breakdown_query)
+            )
 
             # Calculate days pending for oldest
             oldest_date = result['oldest_date'] if result and result['oldest_date'] else None
@@ -199,7 +230,7 @@ async def purchase_pending_approval() -> str:
                     "total_value": float(item['total'])
                 }
 
-            return json.dumps({
+            return dumps({
                 "total_count": int(result['count']) if result else 0,
                 "total_value": float(result['total_value']) if result and result['total_value'] else 0,
                 "oldest_pending_days": days_oldest,
@@ -211,5 +242,21 @@ async def purchase_pending_approval() -> str:
 
     except Exception as e:
         logger.exception("Failed to fetch pending approvals")
-        return json.dumps({"error": f"Failed to fetch pending approvals: {str(e)}"})
+        return dumps({"error": f"Failed to fetch pending approvals: {str(e)}"})
+
+
+def invalidate_cache() -> None:
+    """Drop all cached purchase resources so the next read hits the database."""
+    _purchase_summary_for.cache_invalidate()
+    suppliers_top10.cache_invalidate()
+    purchase_pending_approval.cache_invalidate()
+
 
+async def warm_cache() -> None:
+    """Populate the resource cache concurrently, e.g. at server startup."""
+    await asyncio.gather(
+        purchase_summary_month(),
+        suppliers_top10(),
+        purchase_pending_approval(),
+        return_exceptions=True
+    )
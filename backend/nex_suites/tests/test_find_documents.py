@@ -0,0 +1,60 @@
+"""Regression checks for find_documents pattern matching."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.filesystem import _search_root
+
+
+class SearchRootTest(unittest.TestCase):
+    FILES = [
+        "a.pdf",
+        "report_2024.01.15.pdf",
+        "notes.txt",
+        "sub/b.pdf",
+        "sub/x/y/c.pdf",
+        "docs.v1/invoice.pdf",
+    ]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        for name in self.FILES:
+            path = os.path.join(self.root, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            Path(path).touch()
+        _search_root.cache_invalidate()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def search(self, pattern):
+        results = asyncio.run(_search_root(pattern, self.root, 0))
+        return sorted(os.path.relpath(r["path"], self.root) for r in results)
+
+    def test_double_star_matches_zero_directories(self):
+        self.assertEqual(
+            self.search("**/*.pdf"),
+            sorted(name for name in self.FILES if name.endswith(".pdf"))
+        )
+        self.assertEqual(self.search("sub/**/*.pdf"), ["sub/b.pdf", "sub/x/y/c.pdf"])
+        self.assertEqual(self.search("/sub/**/*.pdf"), ["sub/b.pdf", "sub/x/y/c.pdf"])
+
+    def test_dotted_name_is_a_substring_search(self):
+        self.assertEqual(self.search("2024.01"), ["report_2024.01.15.pdf"])
+        self.assertEqual(self.search("docs.v1/invoice"), ["docs.v1/invoice.pdf"])
+
+    def test_wildcard_extension_filters(self):
+        self.assertEqual(self.search("*.txt"), [])
+        self.assertEqual(self.search("sub/*.pdf"), ["sub/b.pdf"])
+
+
+if __name__ == "__main__":
+    unittest.main()
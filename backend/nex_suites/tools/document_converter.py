@@ -3,15 +3,82 @@ Document conversion module for PDF and image files.
 Supports conversion to text, markdown, and JSON formats.
 """
 
-import json
+import asyncio
+import io
+import multiprocessing
+import os
 import re
+import statistics
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Literal, Optional, List
+from typing import Dict, Any, Iterable, Literal, Optional, List, Tuple, Union
 import pdfplumber
 from PIL import Image
 import pytesseract
 import cv2
 import numpy as np
+from utils.serialization import dumps
+
+
+# Common patterns for receipts/invoices, tried in order for each field
+RECEIPT_PATTERNS = {
+    "receipt_no": [
+        r"No\.?\s*Resit\s*[:]\s*(\S+)",
+        r"Receipt\s*No\.?\s*[:]\s*(\S+)",
+        r"Invoice\s*No\.?\s*[:]\s*(\S+)"
+    ],
+    "datetime": [
+        r"Tarikh\s*Masa\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Date\s*Time\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Date\s*[:]\s*(.+?)(?:[\r\n]|$)"
+    ],
+    "payment_date": [
+        r"Tarikh\s*Bayaran\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Payment\s*Date\s*[:]\s*(.+?)(?:[\r\n]|$)"
+    ],
+    "payment_type": [
+        r"Jenis\s*Bayaran\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Payment\s*Type\s*[:]\s*(.+?)(?:[\r\n]|$)"
+    ],
+    "company_code": [
+        r"Kod\s*Majikan\s*[:]\s*(\S+)",
+        r"Company\s*Code\s*[:]\s*(\S+)",
+        r"Employer\s*Code\s*[:]\s*(\S+)"
+    ],
+    "company_name": [
+        r"Nama\s*Majikan\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Company\s*Name\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Employer\s*Name\s*[:]\s*(.+?)(?:[\r\n]|$)"
+    ],
+    "payment_method": [
+        r"Kaedah\s*Bayaran\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Payment\s*Method\s*[:]\s*(.+?)(?:[\r\n]|$)"
+    ],
+    "transaction_id": [
+        r"FPX\s*Transaksi\s*ID\s*[:]\s*(\S+)",
+        r"Transaction\s*ID\s*[:]\s*(\S+)",
+        r"Reference\s*No\.?\s*[:]\s*(\S+)"
+    ],
+    "bank": [
+        r"Bank\s*[:]\s*(.+?)(?:[\r\n]|$)"
+    ],
+    "total_amount": [
+        r"Jumlah\s*Bayaran\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Total\s*Amount\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Total\s*[:]\s*(.+?)(?:[\r\n]|$)"
+    ],
+    "notes": [
+        r"Catatan\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Notes\s*[:]\s*(.+?)(?:[\r\n]|$)",
+        r"Remarks\s*[:]\s*(.+?)(?:[\r\n]|$)"
+    ]
+}
+
+# Numbered payment lines; [^\S\n] keeps the gap after the number on the same line
+_PAYMENT_ITEM_RE = re.compile(r"^(\d+)\.[^\S\n]*(.+)", re.MULTILINE)
+_LINE_BREAK_RE = re.compile(r'([:\.])\s+')
 
 
 class DocumentConverter:
@@ -20,6 +87,46 @@ class DocumentConverter:
     SUPPORTED_INPUT_FORMATS = ["pdf", "jpg", "jpeg", "png"]
     OUTPUT_FORMATS = ["text", "markdown", "json"]
 
+    # PDFs with at least this many pages are split across worker processes.
+    # All PDFs share one pool, so this caps the total, not the per-PDF, count.
+    PARALLEL_PAGE_THRESHOLD = 8
+    MAX_PDF_WORKERS = os.cpu_count() or 1
+
+    # Longest image side fed to OCR; ~300 DPI for a receipt-sized page
+    MAX_OCR_DIMENSION = 2400
+
+    # Default number of documents convert_many works on at once
+    MAX_CONCURRENT_CONVERSIONS = 4
+
+    # Field patterns used by parse_receipt_data; subclasses may extend them
+    RECEIPT_PATTERNS = RECEIPT_PATTERNS
+
+    # Display label for each parsed field, in output order
+    FIELD_MAPPINGS: Tuple[Tuple[str, str], ...] = (
+        ("Tarikh Masa", "datetime"),
+        ("Tarikh Bayaran", "payment_date"),
+        ("Jenis Bayaran", "payment_type"),
+        ("Kod Majikan", "company_code"),
+        ("Nama Majikan", "company_name"),
+        ("Kaedah Bayaran", "payment_method"),
+        ("FPX Transaksi ID", "transaction_id"),
+        ("Bank", "bank"),
+        ("Jumlah Bayaran", "total_amount"),
+        ("Catatan", "notes")
+    )
+
+    # Casefolded keywords, at least one of which every receipt pattern needs.
+    # Text with none of them is not a receipt and skips the regex scan;
+    # subclasses adding patterns should add their keywords here too.
+    RECEIPT_ANCHORS = (
+        "resit", "receipt", "invoice", "tarikh", "date", "bayaran", "payment",
+        "majikan", "company", "employer", "fpx", "transaction", "reference",
+        "bank", "jumlah", "total", "catatan", "notes", "remarks", "perkeso"
+    )
+
+    _pdf_pool: Optional[ProcessPoolExecutor] = None
+    _pdf_pool_lock = threading.Lock()
+
     @classmethod
     def validate_input(cls, input_path: str) -> Path:
         """Validate the input file exists and is supported."""
@@ -37,15 +144,61 @@ class DocumentConverter:
     @classmethod
     async def convert(cls, input_path: str, output_format: Literal["text", "markdown", "json"]) -> str:
         """Convert document to specified format."""
+        # Extraction (pdfplumber/OCR) is blocking, so keep it off the event loop
+        raw_data = await asyncio.to_thread(cls.extract, input_path)
+        return cls.render(raw_data, output_format)
+
+    @classmethod
+    async def convert_all(
+        cls,
+        input_path: str,
+        output_formats: Optional[List[str]] = None
+    ) -> Dict[str, str]:
+        """
+        Convert document to several formats, extracting (and OCR-ing) it only once.
+        Returns a mapping of output format to rendered content.
+        """
+        raw_data = await asyncio.to_thread(cls.extract, input_path)
+        return {
+            output_format: cls.render(raw_data, output_format)
+            for output_format in (output_formats or cls.OUTPUT_FORMATS)
+        }
+
+    @classmethod
+    async def convert_many(
+        cls,
+        input_paths: List[str],
+        output_format: Literal["text", "markdown", "json"],
+        max_concurrency: Optional[int] = None
+    ) -> List[Union[str, Exception]]:
+        """
+        Convert several documents concurrently, at most max_concurrency at a time.
+        Results are in input order; a failed conversion yields its exception.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or cls.MAX_CONCURRENT_CONVERSIONS)
+
+        async def convert_one(input_path: str) -> str:
+            async with semaphore:
+                return await cls.convert(input_path, output_format)
+
+        return await asyncio.gather(
+            *(convert_one(input_path) for input_path in input_paths),
+            return_exceptions=True
+        )
+
+    @classmethod
+    def extract(cls, input_path: str) -> Dict[str, Any]:
+        """Validate and extract raw data from a document, ready for render()."""
         input_file = cls.validate_input(input_path)
 
         # Extract raw data based on file type
         if input_file.suffix.lower() == ".pdf":
-            raw_data = cls.extract_from_pdf(input_file)
-        else:
-            raw_data = cls.extract_from_image(input_file)
+            return cls.extract_from_pdf(input_file)
+        return cls.extract_from_image(input_file)
 
-        # Format output based on requested format
+    @classmethod
+    def render(cls, raw_data: Dict[str, Any], output_format: str) -> str:
+        """Render previously extracted data in the requested format."""
         if output_format == "text":
             return cls.format_as_text(raw_data)
         elif output_format == "markdown":
@@ -58,27 +211,17 @@ class DocumentConverter:
     @classmethod
     def extract_from_pdf(cls, pdf_path: Path) -> Dict[str, Any]:
         """Extract structured data from PDF."""
-        pages = []
-
         with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text() or ""
-                tables = page.extract_tables() or []
-
-                # Clean up text
-                text = cls.clean_text(text)
+            page_count = len(pdf.pages)
+            parallel = page_count >= cls.PARALLEL_PAGE_THRESHOLD and cls.MAX_PDF_WORKERS > 1
+            if not parallel:
+                pages = [cls._extract_page(page, page_num) for page_num, page in enumerate(pdf.pages, 1)]
 
-                pages.append({
-                    "page": page_num,
-                    "text": text,
-                    "tables": tables,
-                    "width": page.width,
-                    "height": page.height
-                })
+        if parallel:
+            pages = cls._extract_pages_parallel(str(pdf_path), page_count)
 
         # Try to parse structured data from the text
-        full_text = "\n".join(p["text"] for p in pages)
-        parsed = cls.parse_receipt_data(full_text)
+        parsed = cls.parse_receipt_data([p["text"] for p in pages])
 
         return {
             "pages": pages,
@@ -87,30 +230,96 @@ class DocumentConverter:
             "filename": pdf_path.name
         }
 
+    @classmethod
+    def _extract_pages_parallel(cls, pdf_path: str, page_count: int) -> List[Dict[str, Any]]:
+        """Extract contiguous page ranges of a large PDF in worker processes."""
+        workers = min(cls.MAX_PDF_WORKERS, page_count)
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+
+        chunks = cls._get_pdf_pool().map(cls._extract_page_range, [pdf_path] * workers, bounds[:-1], bounds[1:])
+        return [page for chunk in chunks for page in chunk]
+
+    @classmethod
+    def _get_pdf_pool(cls) -> ProcessPoolExecutor:
+        """
+        Return the process-wide PDF worker pool, creating it on first use.
+        Extraction runs in to_thread worker threads, and forking a threaded
+        process is unsafe, so workers come from forkserver (spawn where that
+        is unavailable) rather than the platform default.
+        """
+        with DocumentConverter._pdf_pool_lock:
+            if DocumentConverter._pdf_pool is None:
+                start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                DocumentConverter._pdf_pool = ProcessPoolExecutor(
+                    max_workers=cls.MAX_PDF_WORKERS,
+                    mp_context=multiprocessing.get_context(start_method)
+                )
+            return DocumentConverter._pdf_pool
+
+    @classmethod
+    def shutdown_pdf_pool(cls) -> None:
+        """Stop the shared PDF worker pool; the next large PDF starts a new one."""
+        with DocumentConverter._pdf_pool_lock:
+            pool, DocumentConverter._pdf_pool = DocumentConverter._pdf_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    @classmethod
+    def _extract_page_range(cls, pdf_path: str, start: int, stop: int) -> List[Dict[str, Any]]:
+        """Extract pages [start, stop) (0-based); runs in a worker process."""
+        with pdfplumber.open(pdf_path, pages=list(range(start + 1, stop + 1))) as pdf:
+            return [cls._extract_page(page, page.page_number) for page in pdf.pages]
+
+    @classmethod
+    def _extract_page(cls, page, page_num: int) -> Dict[str, Any]:
+        """Extract text and tables from a single pdfplumber page."""
+        text = page.extract_text() or ""
+        # The default table finder builds cells from ruling lines, so a page
+        # without line/rect/curve edges cannot hold a table; skip the search
+        tables = (page.extract_tables() or []) if page.edges else []
+
+        # Text and tables both came from the page's cached objects; drop them
+        # now rather than holding every parsed page until the PDF is closed
+        page.close()
+
+        # Clean up text
+        text = cls.clean_text(text)
+
+        return {
+            "page": page_num,
+            "text": text,
+            "tables": tables,
+            "width": page.width,
+            "height": page.height
+        }
+
     @classmethod
     def extract_from_image(cls, image_path: Path) -> Dict[str, Any]:
         """Extract text from image using OCR."""
         # Load and preprocess image for better OCR
         image = Image.open(image_path)
+        original_width, original_height = image.size
 
-        # Convert to OpenCV format for preprocessing
-        cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+        # OCR cost grows with pixel count; larger images add work, not accuracy
+        if max(image.size) > cls.MAX_OCR_DIMENSION:
+            image.thumbnail((cls.MAX_OCR_DIMENSION, cls.MAX_OCR_DIMENSION), Image.Resampling.LANCZOS)
 
-        # Preprocess for better OCR accuracy
-        gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
+        # Decode straight to 8-bit grayscale; also handles RGBA/palette/L inputs
+        gray = np.array(image.convert("L"))
 
         # Apply threshold to get black and white image
         _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
-        # Denoise
-        denoised = cv2.medianBlur(thresh, 1)
-
-        # Convert back to PIL for pytesseract
-        processed_image = Image.fromarray(denoised)
+        # Denoise (3 is the smallest kernel that actually filters)
+        denoised = cv2.medianBlur(thresh, 3)
 
-        # Extract text with different configurations
+        # One Tesseract pass returns both the words and their confidences;
+        # pytesseract accepts the array directly
         custom_config = r'--oem 3 --psm 6'
-        text = pytesseract.image_to_string(processed_image, config=custom_config)
+        ocr = pytesseract.image_to_data(
+            denoised, config=custom_config, output_type=pytesseract.Output.DICT
+        )
+        text, confidence = cls._text_from_ocr_data(ocr)
 
         # Clean up text
         text = cls.clean_text(text)
@@ -118,7 +327,7 @@ class DocumentConverter:
         # Parse structured data from text
         parsed = cls.parse_receipt_data(text)
 
-        return {
+        result = {
             "raw_text": text,
             "parsed": parsed,
             "type": "image",
@@ -127,119 +336,111 @@ class DocumentConverter:
                 "name": image_path.name,
                 "width": image.width,
                 "height": image.height,
-                "original_width": image.width,
-                "original_height": image.height
+                "original_width": original_width,
+                "original_height": original_height
             }]
         }
 
+        if confidence is not None:
+            result["ocr_confidence"] = confidence
+
+        return result
+
+    @staticmethod
+    def _text_from_ocr_data(ocr: Dict[str, List[Any]]) -> Tuple[str, Optional[float]]:
+        """
+        Rebuild line text from Tesseract word boxes and average the word confidences.
+        Words are grouped by (block_num, par_num, line_num); entries with
+        confidence -1 are layout rows rather than words.
+        """
+        lines: Dict[Tuple[int, int, int], List[str]] = {}
+        confidences = []
+
+        for word, conf, block, par, line in zip(
+            ocr["text"], ocr["conf"], ocr["block_num"], ocr["par_num"], ocr["line_num"]
+        ):
+            conf = float(conf)
+            if conf < 0 or not word.strip():
+                continue
+            lines.setdefault((block, par, line), []).append(word)
+            confidences.append(conf)
+
+        text = "\n".join(" ".join(words) for words in lines.values())
+        confidence = round(statistics.fmean(confidences), 2) if confidences else None
+        return text, confidence
+
     @classmethod
     def clean_text(cls, text: str) -> str:
         """Clean extracted text."""
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove excessive whitespace (split/join stays in C, no regex needed)
+        text = " ".join(text.split())
         # Fix common OCR issues
-        text = text.replace(' :', ':')
-        text = text.replace(' ,', ',')
+        text = text.replace(' :', ':').replace(' ,', ',')
         # Restore line breaks for structure
-        text = re.sub(r'([:\.])\s+', r'\1\n', text)
+        text = _LINE_BREAK_RE.sub(r'\1\n', text)
         return text.strip()
 
     @classmethod
-    def parse_receipt_data(cls, text: str) -> Dict[str, Any]:
-        """Parse receipt/invoice data into structured format."""
-        data = {}
-        lines = text.split('\n')
-
-        # Common patterns for receipts/invoices
-        patterns = {
-            "receipt_no": [
-                r"No\.?\s*Resit\s*[:]\s*(\S+)",
-                r"Receipt\s*No\.?\s*[:]\s*(\S+)",
-                r"Invoice\s*No\.?\s*[:]\s*(\S+)"
-            ],
-            "datetime": [
-                r"Tarikh\s*Masa\s*[:]\s*(.+?)(?:\n|$)",
-                r"Date\s*Time\s*[:]\s*(.+?)(?:\n|$)",
-                r"Date\s*[:]\s*(.+?)(?:\n|$)"
-            ],
-            "payment_date": [
-                r"Tarikh\s*Bayaran\s*[:]\s*(.+?)(?:\n|$)",
-                r"Payment\s*Date\s*[:]\s*(.+?)(?:\n|$)"
-            ],
-            "payment_type": [
-                r"Jenis\s*Bayaran\s*[:]\s*(.+?)(?:\n|$)",
-                r"Payment\s*Type\s*[:]\s*(.+?)(?:\n|$)"
-            ],
-            "company_code": [
-                r"Kod\s*Majikan\s*[:]\s*(\S+)",
-                r"Company\s*Code\s*[:]\s*(\S+)",
-                r"Employer\s*Code\s*[:]\s*(\S+)"
-            ],
-            "company_name": [
-                r"Nama\s*Majikan\s*[:]\s*(.+?)(?:\n|$)",
-                r"Company\s*Name\s*[:]\s*(.+?)(?:\n|$)",
-                r"Employer\s*Name\s*[:]\s*(.+?)(?:\n|$)"
-            ],
-            "payment_method": [
-                r"Kaedah\s*Bayaran\s*[:]\s*(.+?)(?:\n|$)",
-                r"Payment\s*Method\s*[:]\s*(.+?)(?:\n|$)"
-            ],
-            "transaction_id": [
-                r"FPX\s*Transaksi\s*ID\s*[:]\s*(\S+)",
-                r"Transaction\s*ID\s*[:]\s*(\S+)",
-                r"Reference\s*No\.?\s*[:]\s*(\S+)"
-            ],
-            "bank": [
-                r"Bank\s*[:]\s*(.+?)(?:\n|$)"
-            ],
-            "total_amount": [
-                r"Jumlah\s*Bayaran\s*[:]\s*(.+?)(?:\n|$)",
-                r"Total\s*Amount\s*[:]\s*(.+?)(?:\n|$)",
-                r"Total\s*[:]\s*(.+?)(?:\n|$)"
-            ],
-            "notes": [
-                r"Catatan\s*[:]\s*(.+?)(?:\n|$)",
-                r"Notes\s*[:]\s*(.+?)(?:\n|$)",
-                r"Remarks\s*[:]\s*(.+?)(?:\n|$)"
-            ]
+    @lru_cache(maxsize=None)
+    def _compiled_patterns(cls) -> Dict[str, Tuple[re.Pattern, ...]]:
+        """Compile RECEIPT_PATTERNS once per class, on first use."""
+        return {
+            field: tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in pattern_list)
+            for field, pattern_list in cls.RECEIPT_PATTERNS.items()
         }
 
+    @classmethod
+    def parse_receipt_data(cls, text: Union[str, Iterable[str]]) -> Dict[str, Any]:
+        """
+        Parse receipt/invoice data into structured format.
+        Accepts the document text, or its page texts (joined with newlines).
+        Documents without any receipt keyword return an empty dict.
+        """
+        if not isinstance(text, str):
+            text = "\n".join(text)
+
+        data: Dict[str, Any] = {}
+
+        # Cheap substring gate before running any pattern
+        folded = text.casefold()
+        if not any(anchor in folded for anchor in cls.RECEIPT_ANCHORS):
+            return data
         # Try to extract each field
-        full_text = '\n'.join(lines)
-        for field, pattern_list in patterns.items():
+        for field, pattern_list in cls._compiled_patterns().items():
             for pattern in pattern_list:
-                match = re.search(pattern, full_text, re.IGNORECASE | re.MULTILINE)
+                match = pattern.search(text)
                 if match:
                     data[field] = match.group(1).strip()
                     break
 
-        # Look for payment items (numbered list)
-        payment_items = []
-        for line in lines:
-            item_match = re.match(r"(\d+)\.\s*(.+)", line)
-            if item_match:
-                payment_items.append({
-                    "number": item_match.group(1),
-                    "description": item_match.group(2).strip()
-                })
+        # Look for payment items (numbered list) in one pass over the text
+        payment_items: List[Dict[str, str]] = [
+            {"number": item_match.group(1), "description": item_match.group(2).strip()}
+            for item_match in _PAYMENT_ITEM_RE.finditer(text)
+        ]
 
         if payment_items:
             data["payment_items"] = payment_items
 
         # Extract PERKESO specific data if present
-        if "PERKESO" in full_text:
+        if "PERKESO" in text:
             data["organization"] = "PERKESO"
 
         # Extract title if present
-        if "RESIT RASMI" in full_text:
+        if "RESIT RASMI" in text:
             data["document_type"] = "RESIT RASMI"
 
         return data
 
+    @classmethod
+    def _iter_populated_fields(cls, parsed: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        """(label, value) pairs for the FIELD_MAPPINGS entries present in parsed."""
+        return [(label, parsed[key]) for label, key in cls.FIELD_MAPPINGS if key in parsed]
+
     @classmethod
     def format_as_text(cls, data: Dict[str, Any]) -> str:
         """Format as plain text (like Image #1)."""
-        output = []
+        buf = io.StringIO()
 
         if data.get("parsed"):
             parsed = data["parsed"]
@@ -249,84 +450,65 @@ class DocumentConverter:
                 header = parsed["document_type"]
                 if parsed.get("receipt_no"):
                     header += f"     No. Resit : {parsed['receipt_no']}"
-                output.append(header)
-                output.append("")
+                buf.write(header + "\n")
+                buf.write("\n")
 
             # Organization
             if parsed.get("organization"):
-                output.append(parsed["organization"])
-                output.append("")
+                buf.write(parsed["organization"] + "\n")
+                buf.write("\n")
 
             # Format fields with consistent spacing
-            field_mappings = [
-                ("Tarikh Masa", "datetime"),
-                ("Tarikh Bayaran", "payment_date"),
-                ("Jenis Bayaran", "payment_type"),
-                ("Kod Majikan", "company_code"),
-                ("Nama Majikan", "company_name"),
-                ("Kaedah Bayaran", "payment_method"),
-                ("FPX Transaksi ID", "transaction_id"),
-                ("Bank", "bank"),
-                ("Jumlah Bayaran", "total_amount"),
-                ("Catatan", "notes")
-            ]
-
-            for label, field_key in field_mappings:
-                if field_key in parsed:
-                    value = parsed[field_key]
-                    output.append(f"{label:<20} :     {value}")
+            for label, value in cls._iter_populated_fields(parsed):
+                buf.write(f"{label:<20} :     {value}\n")
 
             # Add payment items if present
             if "payment_items" in parsed:
-                output.append("")
+                buf.write("\n")
                 for item in parsed["payment_items"]:
-                    output.append(f"{item['number']}. {item['description']}")
+                    buf.write(f"{item['number']}. {item['description']}\n")
 
         else:
             # Fallback to raw text
             if data["type"] == "pdf":
                 for page in data.get("pages", []):
-                    output.append(f"Page {page['page']}:")
-                    output.append(page.get("text", ""))
-                    output.append("")
+                    buf.write(f"Page {page['page']}:\n")
+                    buf.write(page.get("text", "") + "\n")
+                    buf.write("\n")
             else:
-                output.append(data.get("raw_text", ""))
+                buf.write(data.get("raw_text", "") + "\n")
 
         # Add footer note if present
         if "Resit ini adalah cetakan komputer" in str(data.get("raw_text", "")):
-            output.append("")
-            output.append('"Resit ini adalah cetakan komputer dan tandatangan tidak diperlukan."')
+            buf.write("\n")
+            buf.write('"Resit ini adalah cetakan komputer dan tandatangan tidak diperlukan."\n')
 
-        return "\n".join(output)
+        # Every line was written newline-terminated; drop the last one as "\n".join would
+        return buf.getvalue()[:-1]
 
     @classmethod
     def format_as_markdown(cls, data: Dict[str, Any]) -> str:
         """Format as markdown with tables matching PERKESO receipt format."""
-        output = []
+        buf = io.StringIO()
 
         if data.get("parsed"):
             parsed = data["parsed"]
 
             # Document header
             if parsed.get("document_type"):
-                output.append(f"# {parsed['document_type']}")
-                output.append("")
+                buf.write(f"# {parsed['document_type']}\n")
+                buf.write("\n")
 
             if parsed.get("receipt_no"):
-                output.append(f"No. Resit : {parsed['receipt_no']}")
-                output.append("")
-                output.append("---")
-                output.append("")
+                buf.write(f"No. Resit : {parsed['receipt_no']}\n")
+                buf.write("\n")
+                buf.write("---\n")
+                buf.write("\n")
 
             # Organization section
             if parsed.get("organization"):
-                output.append(f"## {parsed['organization']}")
-                output.append("")
-
-            # Create clean two-column table
-            output.append("| Tarikh Masa | {} |".format(parsed.get("datetime", "")))
-            output.append("|-------------|-----|")
-            output.append("| Tarikh Bayaran | {} |".format(parsed.get("payment_date", "")))
+                buf.write(f"## {parsed['organization']}\n")
+                buf.write("\n")
 
             # Handle Jenis Bayaran separately as it can be multiline
             jenis_bayaran = parsed.get("payment_type", "")
@@ -335,32 +517,30 @@ class DocumentConverter:
                 for item in parsed["payment_items"]:
                     items.append(f"{item['number']}. {item['description']}")
                 jenis_bayaran = "<br>".join(items) if items else jenis_bayaran
-            output.append("| Jenis Bayaran | {} |".format(jenis_bayaran))
 
-            output.append("| Kod Majikan | {} |".format(parsed.get("company_code", "")))
-            output.append("| Nama Majikan | {} |".format(parsed.get("company_name", "")))
-            output.append("| Kaedah Bayaran | {} |".format(parsed.get("payment_method", "")))
-            output.append("| FPX Transaksi ID | {} |".format(parsed.get("transaction_id", "")))
-            output.append("| Bank | {} |".format(parsed.get("bank", "")))
-            output.append("| Jumlah Bayaran | {} |".format(parsed.get("total_amount", "")))
-            output.append("| Catatan | {} |".format(parsed.get("notes", "")))
+            # Create clean two-column table; every field gets a row, filled or not
+            for row, (label, field_key) in enumerate(cls.FIELD_MAPPINGS):
+                value = jenis_bayaran if field_key == "payment_type" else parsed.get(field_key, "")
+                buf.write(f"| {label} | {value} |\n")
+                if row == 0:
+                    buf.write("|-------------|-----|\n")
 
             # Add footer note if detected
             if "Resit ini adalah cetakan komputer" in str(data.get("raw_text", "")):
-                output.append("")
-                output.append('"Resit ini adalah cetakan komputer dan tandatangan tidak diperlukan."')
+                buf.write("\n")
+                buf.write('"Resit ini adalah cetakan komputer dan tandatangan tidak diperlukan."\n')
 
         else:
             # Fallback to raw content with better formatting
-            output.append("# Document")
-            output.append("")
+            buf.write("# Document\n")
+            buf.write("\n")
             if data["type"] == "pdf":
                 for page in data.get("pages", []):
                     text = page.get("text", "")
                     # Try basic table extraction
                     lines = text.split('\n')
-                    output.append("| Field | Value |")
-                    output.append("|-------|-------|")
+                    buf.write("| Field | Value |\n")
+                    buf.write("|-------|-------|\n")
                     for line in lines:
                         if ':' in line:
                             parts = line.split(':', 1)
@@ -368,12 +548,12 @@ class DocumentConverter:
                                 field = parts[0].strip()
                                 value = parts[1].strip()
                                 if field and value:
-                                    output.append(f"| {field} | {value} |")
+                                    buf.write(f"| {field} | {value} |\n")
             else:
                 text = data.get("raw_text", "")
                 lines = text.split('\n')
-                output.append("| Field | Value |")
-                output.append("|-------|-------|")
+                buf.write("| Field | Value |\n")
+                buf.write("|-------|-------|\n")
                 for line in lines:
                     if ':' in line:
                         parts = line.split(':', 1)
@@ -381,13 +561,24 @@ class DocumentConverter:
                             field = parts[0].strip()
                             value = parts[1].strip()
                             if field and value:
-                                output.append(f"| {field} | {value} |")
+                                buf.write(f"| {field} | {value} |\n")
 
-        return "\n".join(output)
+        # Every line was written newline-terminated; drop the last one as "\n".join would
+        return buf.getvalue()[:-1]
 
     @classmethod
-    def format_as_json(cls, data: Dict[str, Any]) -> str:
-        """Format as JSON (like Image #2)."""
+    def format_as_json(
+        cls,
+        data: Dict[str, Any],
+        pretty: bool = False,
+        include_markdown: bool = False
+    ) -> str:
+        """
+        Format as JSON (like Image #2).
+        Output is compact by default since it is read by MCP clients; pass
+        pretty=True for indented output. The image page "md" field is only
+        rendered when include_markdown is set.
+        """
         json_output = {
             "pages": [],
             "charts": [],
@@ -414,7 +605,7 @@ class DocumentConverter:
             page_data = {
                 "page": 1,
                 "text": data.get("raw_text", ""),
-                "md": cls.format_as_markdown(data),  # Include markdown version
+                "md": cls.format_as_markdown(data) if include_markdown else "",
                 "images": data.get("images", [])
             }
 
@@ -451,4 +642,4 @@ class DocumentConverter:
             "processed_at": None  # Could add timestamp
         }
 
-        return json.dumps(json_output, indent=2, ensure_ascii=False)
\ No newline at end of file
+        return dumps(json_output, pretty=pretty)
\ No newline at end of file
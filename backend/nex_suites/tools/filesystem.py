@@ -3,39 +3,112 @@ Filesystem operations with roots security.
 Follows cli_root's security patterns for safe file access.
 """
 
+import asyncio
+import fnmatch
+import itertools
+import os
+import re
+import stat
+import time
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Annotated, Collection, List, Dict, Any, Iterator, Optional, Literal, Tuple
 from mcp.server.fastmcp import Context
+from pydantic import BaseModel, Field
 from tools.document_converter import DocumentConverter
 from core.utils import file_url_to_path
+from utils.cache import async_ttl_cache
+
+# Listing pages are capped so large folders don't flood stdio and the LLM context
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Repeated searches within this window reuse the previous walk of a root
+FIND_CACHE_TTL = 60
+
+# Matches handed from the walker thread to the event loop at a time
+FIND_BATCH_SIZE = 256
+
+# Client roots are re-requested at most this often per session
+ROOTS_CACHE_TTL = 5
+
+# (root paths as sent by the client, their resolved forms with a trailing separator)
+_RootsEntry = Tuple[List[Path], List[str]]
+
+# session -> (expires_at, roots); entries go away with their session
+_roots_cache: "weakref.WeakKeyDictionary[Any, Tuple[float, _RootsEntry]]" = weakref.WeakKeyDictionary()
+
+
+def _paginate(items: List[Any], limit: int, offset: int) -> Dict[str, Any]:
+    """Slice one page out of a listing and report whether more remain."""
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    if offset < 0:
+        raise ValueError("offset must be >= 0")
+
+    total = len(items)
+    return {
+        "entries": items[offset:offset + limit],
+        "total": total,
+        "has_more": total > offset + limit
+    }
+
+
+async def _get_roots(ctx: Context) -> _RootsEntry:
+    """
+    Client roots for this session as (paths, resolved prefixes), cached for ROOTS_CACHE_TTL.
+    One tool call can check access several times; this keeps it to one list_roots request.
+    """
+    session = ctx.session
+    entry = _roots_cache.get(session)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    roots_result = await session.list_roots()
+    paths = [file_url_to_path(root.uri) for root in roots_result.roots]
+    roots = (paths, [os.path.join(str(path.resolve()), "") for path in paths])
+    _roots_cache[session] = (time.monotonic() + ROOTS_CACHE_TTL, roots)
+    return roots
+
+
+async def invalidate_roots_cache(notification: Any = None) -> None:
+    """Forget cached roots; registered for the client's roots/list_changed notification."""
+    _roots_cache.clear()
+
+
+def _normalize(path: str) -> Path:
+    """
+    Make a tool's path argument absolute without touching the filesystem.
+    Symlinks are left alone; is_path_allowed resolves them once for the
+    access check.
+    """
+    return Path(os.path.abspath(path))
 
 
 async def is_path_allowed(requested_path: Path, ctx: Context) -> bool:
     """Check if path is within allowed roots."""
-    roots_result = await ctx.session.list_roots()
-    client_roots = roots_result.roots
+    _, root_prefixes = await _get_roots(ctx)
 
-    # Resolve to absolute path
-    requested_path = requested_path.resolve()
+    # Resolve symlinks so a link inside a root cannot point outside it
+    path_str = os.path.realpath(requested_path)
 
-    if not requested_path.exists():
+    # One stat answers both "does it exist" and "is it a file"
+    try:
+        st = os.stat(path_str)
+    except (FileNotFoundError, NotADirectoryError):
         return False
 
     # If it's a file, check its parent directory
-    if requested_path.is_file():
-        requested_path = requested_path.parent
+    if stat.S_ISREG(st.st_mode):
+        path_str = os.path.dirname(path_str)
 
-    # Check if path is within any allowed root
-    for root in client_roots:
-        root_path = file_url_to_path(root.uri)
-        try:
-            # This will raise ValueError if not relative
-            requested_path.relative_to(root_path)
-            return True
-        except ValueError:
-            continue
-
-    return False
+    # Check if path is within any allowed root; both sides are resolved,
+    # so a prefix match on the separator-terminated root is exact
+    return any(
+        path_str.startswith(prefix) or path_str == prefix[:-1]
+        for prefix in root_prefixes
+    )
 
 
 async def list_roots(ctx: Context) -> List[str]:
@@ -44,24 +117,29 @@ async def list_roots(ctx: Context) -> List[str]:
     These are the root directories where files can be read from or written to.
     """
     try:
-        roots_result = await ctx.session.list_roots()
-        client_roots = roots_result.roots
-
-        root_paths = []
-        for root in client_roots:
-            path = file_url_to_path(root.uri)
-            root_paths.append(str(path))
-
-        return root_paths
+        root_paths, _ = await _get_roots(ctx)
+        return [str(path) for path in root_paths]
     except Exception as e:
         # Remove ctx.info that causes async warning
         # Just return empty list on error
         return []
 
 
-async def read_directory(path: str, *, ctx: Context) -> List[Dict[str, Any]]:
-    """Read directory contents. Path must be within one of the client's roots."""
-    requested_path = Path(path).resolve()
+async def read_directory(
+    path: Annotated[str, Field(description="Directory path to read")],
+    limit: Annotated[
+        int,
+        Field(description="Maximum entries to return", ge=1, le=MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    offset: Annotated[int, Field(description="Number of entries to skip", ge=0)] = 0,
+    *,
+    ctx: Context
+) -> Dict[str, Any]:
+    """
+    Read directory contents. Path must be within one of the client's roots.
+    Returns one page of entries plus the total count and a has_more flag.
+    """
+    requested_path = _normalize(path)
 
     # Validate access
     if not await is_path_allowed(requested_path, ctx):
@@ -70,39 +148,295 @@ async def read_directory(path: str, *, ctx: Context) -> List[Dict[str, Any]]:
     if not requested_path.is_dir():
         raise ValueError(f"Error: '{path}' is not a directory")
 
-    files = []
     try:
-        for entry in requested_path.iterdir():
+        # DirEntry answers is_dir() from the dirent type, without a stat per entry
+        with os.scandir(requested_path) as it:
+            entries = [(entry.is_dir(), entry) for entry in it]
+
+        # Sort: directories first, then files
+        entries.sort(key=lambda x: (not x[0], x[1].name.lower()))
+
+        page = _paginate(entries, limit, offset)
+
+        # Only stat the entries actually returned, once each
+        files = []
+        for is_dir, entry in page["entries"]:
             file_info = {
                 "name": entry.name,
-                "type": "directory" if entry.is_dir() else "file",
-                "path": str(entry)
+                "type": "directory" if is_dir else "file",
+                "path": entry.path
             }
 
             if entry.is_file():
-                file_info["extension"] = entry.suffix.lower()
+                file_info["extension"] = os.path.splitext(entry.name)[1].lower()
                 file_info["size"] = entry.stat().st_size
 
             files.append(file_info)
 
-        # Sort: directories first, then files
-        files.sort(key=lambda x: (x["type"] == "file", x["name"].lower()))
+        page["entries"] = files
 
     except PermissionError:
         raise ValueError(f"Error: Permission denied accessing '{path}'")
 
-    return files
+    return page
+
+
+def _mtime_ns(path: Path) -> int:
+    """Modification stamp of a root, used to expire cached searches early."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+# Any of these makes a pattern segment a wildcard rather than a literal name
+_MAGIC_RE = re.compile(r"[*?[]")
+# A final segment ending in a literal extension, e.g. "*.pdf"
+_EXT_RE = re.compile(r"\.([^.*?[\]]+)$")
+
+# Built once so each candidate file costs one hashed lookup
+_SUPPORTED_EXTENSIONS = frozenset(DocumentConverter.SUPPORTED_INPUT_FORMATS)
+# Prepended to a file-name regex whose pattern names no extension, so the
+# one match per entry also rejects unsupported file types
+_SUPPORTED_LOOKAHEAD = r"(?=(?s:.*)\.(?i:%s)\Z)" % "|".join(
+    map(re.escape, sorted(_SUPPORTED_EXTENSIONS))
+)
+
+
+# A compiled pattern component; None stands for a '**' segment
+_Part = Optional["re.Pattern[str]"]
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> Tuple[Tuple[str, ...], Tuple[_Part, ...]]:
+    """
+    Split a find_documents pattern into a literal directory prefix and one
+    regex per remaining path component. Cached, since chat-driven searches
+    repeat the same patterns.
+    A '**' segment becomes None and matches zero or more directories, as in
+    Path.glob. A pattern ending in '**' names directories only, so it
+    compiles to no parts.
+    A pattern without wildcards is a partial name, matched as *pattern*. Only
+    patterns anchored at the root (leading '/') have a literal prefix.
+    Unless the pattern ends in a literal extension, the file-name regex only
+    matches supported document types.
+    """
+    anchored = pattern.startswith("/")
+    segments = [seg for seg in pattern.split("/") if seg]
+    # Consecutive '**' segments match the same directories as one
+    segments = [
+        seg for i, seg in enumerate(segments)
+        if not (seg == "**" and i and segments[i - 1] == "**")
+    ]
+    if not segments or segments[-1] == "**":
+        return (), ()
+    if anchored and ".." in segments:
+        # The literal prefix is joined onto the root, so it must not climb out of it
+        raise ValueError("Patterns starting with '/' cannot contain '..'")
+
+    if not _MAGIC_RE.search(pattern):
+        if anchored:
+            segments[-1] = f"*{segments[-1]}*"
+        else:
+            segments[0] = f"*{segments[0]}"
+            segments[-1] = f"{segments[-1]}*"
+
+    prefix = []
+    if anchored:
+        while len(segments) > 1 and not _MAGIC_RE.search(segments[0]):
+            prefix.append(segments.pop(0))
+
+    translated = [None if seg == "**" else fnmatch.translate(seg) for seg in segments]
+    if not _EXT_RE.search(segments[-1]):
+        translated[-1] = _SUPPORTED_LOOKAHEAD + translated[-1]
+
+    return tuple(prefix), tuple(
+        None if regex is None else re.compile(regex) for regex in translated
+    )
+
+
+def _match_dirs(parts: Tuple[_Part, ...], names: Tuple[str, ...]) -> bool:
+    """Whether directory names match parts exactly, each None matching zero or more names."""
+    if not parts:
+        return not names
+    part, rest = parts[0], parts[1:]
+    if part is None:
+        return any(_match_dirs(rest, names[i:]) for i in range(len(names) + 1))
+    return bool(names) and part.match(names[0]) is not None and _match_dirs(rest, names[1:])
+
+
+def _document_info(entry: os.DirEntry, extensions: Collection[str]) -> Optional[Dict[str, Any]]:
+    """Describe a matched file, or None if it is not a supported document type."""
+    ext = os.path.splitext(entry.name)[1].lower()[1:]
+    if ext not in extensions:
+        return None
+    return {
+        "path": entry.path,
+        "name": entry.name,
+        "extension": ext,
+        "size": entry.stat().st_size
+    }
+
+
+def _scan_recursive(
+    root: str,
+    parts: Tuple[_Part, ...],
+    extensions: Collection[str],
+    dir_parts: Tuple[str, ...] = (),
+    anchored: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield supported documents under root whose trailing path components match parts.
+    Mirrors Path.glob("**/<pattern>"): files of a directory come before its
+    subdirectories, and symlinked directories are not descended into.
+    When anchored, the directory components must match parts from root on
+    rather than only at the end.
+    """
+    # Bound once; the loop below runs for every entry in the tree
+    name_match, dir_res = parts[-1].match, parts[:-1]
+    if not anchored:
+        # The implicit leading '**' of Path.glob("**/<pattern>")
+        dir_res = (None,) + dir_res
+    # A lone '**' accepts every directory
+    check_dirs = dir_res != (None,)
+    subdirs = []
+    add_subdir = subdirs.append
+
+    try:
+        it = os.scandir(root)
+    except OSError:
+        # Missing or unreadable directories are skipped, as glob does
+        return
+
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                add_subdir(entry)
+            elif name_match(entry.name) and entry.is_file():
+                # The file's directories must match the leading pattern parts
+                if check_dirs and not _match_dirs(dir_res, dir_parts):
+                    continue
+                info = _document_info(entry, extensions)
+                if info:
+                    yield info
+
+    for entry in subdirs:
+        yield from _scan_recursive(entry.path, parts, extensions, dir_parts + (entry.name,), anchored)
+
+
+def _scan_anchored(
+    directory: str,
+    parts: Tuple[_Part, ...],
+    extensions: Collection[str]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield supported documents at exactly directory/<parts>, visiting only
+    matching subdirectories. parts must not contain '**'.
+    """
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        return
+
+    part, rest = parts[0], parts[1:]
+    subdirs = []
+    with it:
+        for entry in it:
+            if not part.match(entry.name):
+                continue
+            if rest:
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                info = _document_info(entry, extensions)
+                if info:
+                    yield info
+
+    for subdir in subdirs:
+        yield from _scan_anchored(subdir, rest, extensions)
+
+
+async def _collect_in_thread(
+    matches: Iterator[Dict[str, Any]],
+    root_path: str
+) -> List[Dict[str, Any]]:
+    """
+    Drain a walker in worker threads, FIND_BATCH_SIZE matches at a time.
+    The next batch is walked while the current one is processed, and the
+    event loop stays free while the disk is read.
+    """
+    batches = iter(lambda: list(itertools.islice(matches, FIND_BATCH_SIZE)), [])
+    results = []
+
+    pending = asyncio.ensure_future(asyncio.to_thread(next, batches, None))
+    try:
+        while (batch := await pending) is not None:
+            pending = asyncio.ensure_future(asyncio.to_thread(next, batches, None))
+            for match in batch:
+                match["root"] = root_path
+            results.extend(batch)
+    finally:
+        pending.cancel()
+
+    return results
+
+
+@async_ttl_cache(ttl=FIND_CACHE_TTL)
+async def _search_root(pattern: str, root_path: str, mtime_ns: int) -> List[Dict[str, Any]]:
+    """
+    Walk one root for supported documents matching pattern.
+    mtime_ns is only part of the cache key, so adding or removing files
+    directly under the root invalidates the cached walk.
+    """
+    prefix, parts = _compile_pattern(pattern)
+    if not parts:
+        return []
+
+    extensions: Collection[str] = _SUPPORTED_EXTENSIONS
+    # Only a wildcard pattern's final segment names an extension; a plain
+    # name such as '2024.01' is a substring search and must not short-circuit
+    ext_match = _MAGIC_RE.search(pattern) and _EXT_RE.search(pattern.rsplit("/", 1)[-1])
+    if ext_match:
+        # "*.txt" can never match a supported document; "*.pdf" needs only one type
+        ext = ext_match.group(1).lower()
+        if ext not in extensions:
+            return []
+        extensions = frozenset((ext,))
+
+    if pattern.startswith("/"):
+        start = os.path.join(root_path, *prefix)
+        if None in parts:
+            # '**' can match any depth, so the whole subtree is walked
+            matches = _scan_recursive(start, parts, extensions, anchored=True)
+        else:
+            matches = _scan_anchored(start, parts, extensions)
+    else:
+        matches = _scan_recursive(root_path, parts, extensions)
+
+    return await _collect_in_thread(matches, root_path)
 
 
 async def find_documents(
-    pattern: str,
-    root_path: Optional[str] = None,
+    pattern: Annotated[
+        str,
+        Field(description="Search pattern (e.g., '*.pdf', 'invoice', 'receipt*'); "
+                          "start with '/' to match from the root (e.g., '/reports/*.pdf')")
+    ],
+    root_path: Annotated[Optional[str], Field(description="Specific root to search in (optional)")] = None,
+    limit: Annotated[
+        int,
+        Field(description="Maximum matches to return", ge=1, le=MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    offset: Annotated[int, Field(description="Number of matches to skip", ge=0)] = 0,
     *,
     ctx: Context
-) -> List[Dict[str, Any]]:
+) -> Dict[str, Any]:
     """
     Find documents matching a pattern within allowed roots.
-    Pattern can be a glob pattern like '*.pdf' or a partial filename.
+    Pattern can be a glob pattern like '*.pdf' or a partial filename, matched
+    at any depth; a leading '/' anchors it at the root so only the named
+    subdirectories are searched.
+    Returns one page of matches plus the total count and a has_more flag.
     """
     results = []
     roots = await list_roots(ctx)
@@ -118,40 +452,16 @@ async def find_documents(
 
     for root in search_paths:
         try:
-            # Use glob to find matching files
-            if '*' in pattern or '?' in pattern:
-                # It's a glob pattern
-                matches = root.glob(f"**/{pattern}")
-            else:
-                # It's a partial filename, search for it
-                matches = root.glob(f"**/*{pattern}*")
-
-            for match in matches:
-                if match.is_file():
-                    # Check if it's a supported document type
-                    ext = match.suffix.lower()[1:]
-                    if ext in DocumentConverter.SUPPORTED_INPUT_FORMATS:
-                        results.append({
-                            "path": str(match),
-                            "name": match.name,
-                            "extension": ext,
-                            "size": match.stat().st_size,
-                            "root": str(root)
-                        })
+            results.extend(await _search_root(pattern, str(root), _mtime_ns(root)))
         except Exception as e:
             ctx.info(f"Error searching in {root}: {str(e)}")
 
-    return results
+    return _paginate(results, limit, offset)
 
 
-async def convert_document(
-    input_path: str,
-    output_format: str = "markdown",
-    *,
-    ctx: Context
-) -> str:
-    """Convert document to specified format with roots validation."""
-    input_file = Path(input_path).resolve()
+async def _check_source(input_path: str, ctx: Context) -> Path:
+    """Resolve a document to convert, ensuring it is a file within allowed roots."""
+    input_file = _normalize(input_path)
 
     # Security check - ensure file is within allowed roots
     if not await is_path_allowed(input_file, ctx):
@@ -160,10 +470,26 @@ async def convert_document(
     if not input_file.is_file():
         raise ValueError(f"Error: '{input_path}' is not a file")
 
-    # Validate output format
+    return input_file
+
+
+def _check_output_format(output_format: str) -> None:
     if output_format not in DocumentConverter.OUTPUT_FORMATS:
         raise ValueError(f"Invalid output format '{output_format}'. Must be one of: {DocumentConverter.OUTPUT_FORMATS}")
 
+
+async def convert_document(
+    input_path: Annotated[str, Field(description="Path to PDF or image file")],
+    output_format: Annotated[str, Field(description="Output format: 'text', 'markdown', or 'json'")] = "markdown",
+    *,
+    ctx: Context
+) -> str:
+    """Convert document to specified format with roots validation."""
+    input_file = await _check_source(input_path, ctx)
+
+    # Validate output format
+    _check_output_format(output_format)
+
     try:
         # Log progress
         ctx.info(f"Starting conversion of {input_file.name} to {output_format}")
@@ -181,10 +507,75 @@ async def convert_document(
         raise ValueError(error_msg)
 
 
+async def convert_document_formats(
+    input_path: Annotated[str, Field(description="Path to PDF or image file")],
+    output_formats: Annotated[
+        Optional[List[str]],
+        Field(description="Output formats from 'text', 'markdown', 'json'; defaults to all three")
+    ] = None,
+    *,
+    ctx: Context
+) -> Dict[str, str]:
+    """
+    Convert document to several formats at once with roots validation.
+    The document is extracted (and OCR-ed) only once; returns a mapping of
+    output format to converted content.
+    """
+    input_file = await _check_source(input_path, ctx)
+
+    for output_format in output_formats or ():
+        _check_output_format(output_format)
+
+    try:
+        await ctx.info(f"Starting conversion of {input_file.name} to {', '.join(output_formats or DocumentConverter.OUTPUT_FORMATS)}")
+
+        result = await DocumentConverter.convert_all(str(input_file), output_formats)
+
+        await ctx.info(f"Successfully converted {input_file.name}")
+
+        return result
+
+    except Exception as e:
+        error_msg = f"Failed to convert {input_file.name}: {str(e)}"
+        await ctx.info(error_msg)
+        raise ValueError(error_msg)
+
+
+async def convert_documents(
+    input_paths: Annotated[List[str], Field(description="Paths to PDF or image files")],
+    output_format: Annotated[str, Field(description="Output format: 'text', 'markdown', or 'json'")] = "markdown",
+    *,
+    ctx: Context
+) -> List[Dict[str, Any]]:
+    """
+    Convert several documents to one format with roots validation.
+    Documents convert concurrently; results keep the order of ``input_paths``
+    and a failing document reports its error without affecting the others.
+    """
+    _check_output_format(output_format)
+
+    checked = await asyncio.gather(*(_check_source(p, ctx) for p in input_paths), return_exceptions=True)
+    sources = [str(c) for c in checked if isinstance(c, Path)]
+
+    await ctx.info(f"Starting conversion of {len(sources)} documents to {output_format}")
+    converted = iter(await DocumentConverter.convert_many(sources, output_format))
+
+    results = []
+    for input_path, source in zip(input_paths, checked):
+        outcome = next(converted) if isinstance(source, Path) else source
+        if isinstance(outcome, BaseException):
+            results.append({"path": input_path, "error": str(outcome)})
+        else:
+            results.append({"path": input_path, "result": outcome})
+
+    await ctx.info(f"Converted {sum('result' in r for r in results)} of {len(input_paths)} documents")
+    return results
+
+
 async def save_conversion(
-    input_path: str,
-    output_path: str,
-    output_format: str = "markdown",
+    input_path: Annotated[str, Field(description="Path to source document")],
+    output_path: Annotated[str, Field(description="Path where to save the converted file")],
+    output_format: Annotated[str, Field(description="Output format: 'text', 'markdown', or 'json'")] = "markdown",
     *,
     ctx: Context
 ) -> str:
@@ -192,10 +583,12 @@ async def save_conversion(
     Convert document and save to file.
     Both input and output paths must be within allowed roots.
     """
-    output_file = Path(output_path).resolve()
+    output_file = _normalize(output_path)
 
-    # Check output path is allowed
-    if not await is_path_allowed(output_file.parent, ctx):
+    # Check output path is allowed; an existing file is checked itself, so
+    # overwriting a symlink cannot write outside the roots
+    target = output_file if os.path.lexists(output_file) else output_file.parent
+    if not await is_path_allowed(target, ctx):
         raise ValueError(f"Access denied: Cannot write to '{output_path}'")
 
     # Perform conversion
@@ -203,8 +596,47 @@ async def save_conversion(
 
     # Save to file
     try:
-        output_file.write_text(result, encoding='utf-8')
+        # Large conversions would otherwise block the event loop while writing
+        await asyncio.to_thread(output_file.write_text, result, encoding='utf-8')
+        # The new file should show up in the next search
+        _search_root.cache_invalidate()
         ctx.info(f"Saved conversion to {output_file}")
         return f"Successfully converted and saved to {output_file}"
     except Exception as e:
-        raise ValueError(f"Failed to save file: {str(e)}")
\ No newline at end of file
+        raise ValueError(f"Failed to save file: {str(e)}")
+
+
+class FsOp(BaseModel):
+    """A single read-only operation inside an fs_batch call."""
+    kind: Literal["list_roots", "read_directory", "find_documents"]
+    args: Dict[str, Any] = Field(default_factory=dict)
+
+
+_BATCH_DISPATCH = {
+    "list_roots": lambda args, ctx: list_roots(ctx),
+    "read_directory": lambda args, ctx: read_directory(**args, ctx=ctx),
+    "find_documents": lambda args, ctx: find_documents(**args, ctx=ctx),
+}
+
+
+async def _run_op(op: FsOp, ctx: Context) -> Dict[str, Any]:
+    try:
+        return {"kind": op.kind, "result": await _BATCH_DISPATCH[op.kind](op.args, ctx)}
+    except Exception as e:
+        return {"kind": op.kind, "error": str(e)}
+
+
+async def fs_batch(
+    ops: Annotated[
+        List[FsOp],
+        Field(description="Operations to run, e.g. [{'kind': 'find_documents', 'args': {'pattern': '*.pdf'}}]")
+    ],
+    *,
+    ctx: Context
+) -> List[Dict[str, Any]]:
+    """
+    Run several read-only filesystem operations in one call.
+    Operations run concurrently; results keep the order of ``ops`` and a
+    failing operation reports its error without affecting the others.
+    """
+    return await asyncio.gather(*(_run_op(op, ctx) for op in ops))
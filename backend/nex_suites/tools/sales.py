@@ -1,6 +1,6 @@
 """Sales management tools for MCP server with TODO enforcement."""
 
-from typing import Dict, Any, List, Optional
+from typing import Annotated, Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from pydantic import Field
@@ -127,7 +127,7 @@ def parse_period(period: str) -> tuple[datetime, datetime]:
     description="Get sales data and format as table (MAXIMUM enforcement with TODO tracking)"
 )
 async def get_sales(
-    period: str = Field(description="Time period (e.g., 'AUG', 'last 3 months')"),
+    period: Annotated[str, Field(description="Time period (e.g., 'AUG', 'last 3 months', '2024', '6 months')")],
     *,
     context: Context
 ) -> str:
@@ -204,7 +204,7 @@ async def get_sales(
     description="Read the detail of a sales invoice and return comprehensive information including customer and items"
 )
 async def get_sales_detail(
-    invoice_no: str = Field(description="Invoice number to retrieve details for (e.g., 'INV001', 'SI25080001')"),
+    invoice_no: Annotated[str, Field(description="Invoice number to retrieve details for (e.g., '2508000932', 'SI25080001')")],
     *,
     context: Context
 ) -> str:
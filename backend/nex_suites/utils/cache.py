@@ -0,0 +1,68 @@
+"""Small in-process caching helpers for Nex Suites."""
+
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+def async_ttl_cache(
+    ttl: float,
+    cache_if: Optional[Callable[[Any], bool]] = None
+) -> Callable:
+    """
+    Cache the results of an async function for ``ttl`` seconds.
+
+    Concurrent calls with the same arguments share one in-flight call.
+    Results are only stored when ``cache_if(result)`` is true, so error
+    payloads can be retried on the next call.
+
+    The wrapped function gains a ``cache_invalidate()`` method that drops
+    every cached entry.
+
+    Args:
+        ttl: Seconds a cached result stays valid
+        cache_if: Optional predicate deciding whether a result is cached
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        entries: Dict[Tuple, Tuple[float, Any]] = {}
+        pending: Dict[Tuple, asyncio.Task] = {}
+        generation = 0
+
+        def store(key: Tuple, started: int, task: asyncio.Task) -> None:
+            if pending.get(key) is task:
+                del pending[key]
+            # exception() also marks a failure as retrieved for asyncio
+            if task.cancelled() or task.exception() is not None or started != generation:
+                return
+            result = task.result()
+            if cache_if is None or cache_if(result):
+                entries[key] = (time.monotonic() + ttl, result)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+            entry = entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            task = pending.get(key)
+            if task is None:
+                task = asyncio.create_task(func(*args, **kwargs))
+                pending[key] = task
+                task.add_done_callback(functools.partial(store, key, generation))
+
+            # Shielded so one cancelled caller does not cancel the shared call
+            return await asyncio.shield(task)
+
+        def cache_invalidate() -> None:
+            nonlocal generation
+            generation += 1
+            entries.clear()
+            pending.clear()
+
+        wrapper.cache_invalidate = cache_invalidate
+        return wrapper
+
+    return decorator
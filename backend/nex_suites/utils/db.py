@@ -3,15 +3,27 @@
 import aiomysql
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from contextlib import asynccontextmanager
-from config import db_config
+from functools import lru_cache
+from config import get_db_config
 
 logger = logging.getLogger(__name__)
 
 # MCP-compliant timeout (2 minutes default)
 DEFAULT_TIMEOUT = 120  # seconds
 
+# Process-wide pool used when no explicit connection parameters are given
+SHARED_POOL_MINSIZE = 1
+SHARED_POOL_MAXSIZE = 20
+# Recycle pooled connections before MariaDB's wait_timeout drops them
+SHARED_POOL_RECYCLE = 3600  # seconds
+
+# Rows fetch_stream reads per round of the server-side cursor
+STREAM_BATCH_SIZE = 1000
+
+_shared_pool_task: Optional["asyncio.Task[aiomysql.Pool]"] = None
+
 
 class DatabaseConnection:
     """MariaDB connection manager using aiomysql."""
@@ -33,6 +45,7 @@ class DatabaseConnection:
             password: Database password
             database: Database name
         """
+        db_config = get_db_config()
         self.host = host or db_config.host
         self.port = port or db_config.port
         self.user = user or db_config.user
@@ -78,7 +91,8 @@ class DatabaseConnection:
         self, 
         minsize: int = 1, 
         maxsize: int = 10,
-        timeout: int = DEFAULT_TIMEOUT
+        timeout: int = DEFAULT_TIMEOUT,
+        pool_recycle: int = -1
     ):
         """Create connection pool for better performance.
         
@@ -86,6 +100,7 @@ class DatabaseConnection:
             minsize: Minimum pool size
             maxsize: Maximum pool size  
             timeout: Connection timeout in seconds
+            pool_recycle: Seconds after which idle connections are replaced (-1 = never)
         """
         try:
             logger.debug(
@@ -100,6 +115,7 @@ class DatabaseConnection:
                     db=self.database,
                     minsize=minsize,
                     maxsize=maxsize,
+                    pool_recycle=pool_recycle,
                     autocommit=True,
                     charset='utf8mb4'
                 ),
@@ -129,6 +145,25 @@ class DatabaseConnection:
             # Log at debug level for cleanup errors
             logger.debug("Error during disconnect (non-critical)")
     
+    @asynccontextmanager
+    async def _cursor(self, *cursor_classes: type):
+        """
+        Yield a cursor from the pool or the single connection, closing it
+        (and releasing a pooled connection) when the block exits.
+        
+        Args:
+            cursor_classes: Optional aiomysql cursor classes, e.g. DictCursor
+        """
+        if self.pool:
+            async with self.pool.acquire() as conn:
+                async with conn.cursor(*cursor_classes) as cursor:
+                    yield cursor
+        elif self.connection:
+            async with self.connection.cursor(*cursor_classes) as cursor:
+                yield cursor
+        else:
+            raise RuntimeError("No database connection available")
+    
     async def execute(self, query: str, params: Optional[Union[tuple, list]] = None) -> int:
         """
         Execute a database query (INSERT, UPDATE, DELETE).
@@ -140,27 +175,13 @@ class DatabaseConnection:
         Returns:
             Number of affected rows
         """
-        cursor = None
         try:
-            if self.pool:
-                async with self.pool.acquire() as conn:
-                    async with conn.cursor() as cursor:
-                        await cursor.execute(query, params)
-                        return cursor.rowcount
-            elif self.connection:
-                cursor = await self.connection.cursor()
+            async with self._cursor() as cursor:
                 await cursor.execute(query, params)
                 return cursor.rowcount
-            else:
-                raise RuntimeError("No database connection available")
         except aiomysql.Error as e:
             logger.exception("Database query execution failed")
             raise
-        except RuntimeError:
-            raise
-        finally:
-            if cursor and not self.pool:
-                await cursor.close()
     
     async def fetch_one(self, query: str, params: Optional[Union[tuple, list]] = None) -> Optional[Dict[str, Any]]:
         """
@@ -173,31 +194,18 @@ class DatabaseConnection:
         Returns:
             Single row as dictionary or None
         """
-        cursor = None
         try:
-            if self.pool:
-                async with self.pool.acquire() as conn:
-                    async with conn.cursor(aiomysql.DictCursor) as cursor:
-                        await cursor.execute(query, params)
-                        return await cursor.fetchone()
-            elif self.connection:
-                cursor = await self.connection.cursor(aiomysql.DictCursor)
+            async with self._cursor(aiomysql.DictCursor) as cursor:
                 await cursor.execute(query, params)
                 return await cursor.fetchone()
-            else:
-                raise RuntimeError("No database connection available")
         except aiomysql.Error as e:
             logger.exception("Failed to fetch single row")
             raise
-        except RuntimeError:
-            raise
-        finally:
-            if cursor and not self.pool:
-                await cursor.close()
     
     async def fetch_all(self, query: str, params: Optional[Union[tuple, list]] = None) -> List[Dict[str, Any]]:
         """
         Fetch all rows from database.
+        The whole result set is buffered; use fetch_stream for large ones.
         
         Args:
             query: SQL query to execute
@@ -206,27 +214,127 @@ class DatabaseConnection:
         Returns:
             List of rows as dictionaries
         """
-        cursor = None
         try:
-            if self.pool:
-                async with self.pool.acquire() as conn:
-                    async with conn.cursor(aiomysql.DictCursor) as cursor:
-                        await cursor.execute(query, params)
-                        return await cursor.fetchall()
-            elif self.connection:
-                cursor = await self.connection.cursor(aiomysql.DictCursor)
+            async with self._cursor(aiomysql.DictCursor) as cursor:
                 await cursor.execute(query, params)
                 return await cursor.fetchall()
-            else:
-                raise RuntimeError("No database connection available")
         except aiomysql.Error as e:
             logger.exception("Failed to fetch rows")
             raise
-        except RuntimeError:
+
+    async def fetch_stream(
+        self,
+        query: str,
+        params: Optional[Union[tuple, list]] = None,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream rows from database with a server-side cursor.
+        
+        Use this instead of fetch_all for queries that can return thousands
+        of rows; fetch_all buffers the whole result set client-side. The
+        connection stays busy until the iteration finishes or is closed.
+        
+        Args:
+            query: SQL query to execute
+            params: Optional query parameters as tuple or list
+            batch_size: Rows read from the server per fetchmany call
+        
+        Yields:
+            Rows as dictionaries
+        """
+        try:
+            async with self._cursor(aiomysql.SSDictCursor) as cursor:
+                await cursor.execute(query, params)
+                # One fetchmany per batch instead of one fetchone per row
+                while rows := await cursor.fetchmany(batch_size):
+                    for row in rows:
+                        yield row
+        except aiomysql.Error as e:
+            logger.exception("Failed to stream rows")
             raise
-        finally:
-            if cursor and not self.pool:
-                await cursor.close()
+
+
+async def _create_shared_pool() -> aiomysql.Pool:
+    conn = DatabaseConnection()
+    await conn.create_pool(
+        SHARED_POOL_MINSIZE,
+        SHARED_POOL_MAXSIZE,
+        pool_recycle=SHARED_POOL_RECYCLE
+    )
+    return conn.pool
+
+
+async def get_shared_pool() -> aiomysql.Pool:
+    """
+    Return the process-wide connection pool, creating it on first use.
+    Concurrent first callers share one creation; a failed or closed pool
+    is rebuilt on the next call.
+    """
+    global _shared_pool_task
+    loop = asyncio.get_running_loop()
+    task = _shared_pool_task
+
+    stale = (
+        task is None
+        or task.get_loop() is not loop
+        or (task.done() and (task.cancelled() or task.exception() is not None or task.result().closed))
+    )
+    if stale:
+        task = _shared_pool_task = loop.create_task(_create_shared_pool())
+
+    return await asyncio.shield(task)
+
+
+async def init_shared_pool() -> None:
+    """
+    Open the process-wide pool ahead of the first query, e.g. at server
+    startup. A failure is only logged; the next get_shared_pool() retries.
+    """
+    try:
+        await get_shared_pool()
+        logger.debug("Shared connection pool ready")
+    except Exception as e:
+        # create_pool has already logged the traceback
+        logger.warning(f"Could not open the shared connection pool at startup: {e}")
+
+
+async def close_shared_pool():
+    """Close the process-wide pool, if one was created. Call on shutdown."""
+    global _shared_pool_task
+    task, _shared_pool_task = _shared_pool_task, None
+    if task is None:
+        return
+    if not task.done():
+        task.cancel()
+        return
+    if task.cancelled() or task.exception() is not None:
+        return
+
+    pool = task.result()
+    pool.close()
+    await pool.wait_closed()
+    logger.debug("Shared connection pool closed")
+
+
+def _is_default_target(*params) -> bool:
+    return all(param is None for param in params)
+
+
+@lru_cache(maxsize=1)
+def _shared_connection() -> DatabaseConnection:
+    """
+    The single DatabaseConnection handed out for the shared pool.
+    Callers must not disconnect() it; close_shared_pool() shuts the pool down.
+    """
+    return DatabaseConnection()
+
+
+async def _shared_pool_connection() -> DatabaseConnection:
+    conn = _shared_connection()
+    # Refreshed on every use in case the pool was rebuilt
+    conn.pool = await get_shared_pool()
+    return conn
 
 
 @asynccontextmanager
@@ -237,7 +345,8 @@ async def get_db_connection(host: Optional[str] = None,
                            database: Optional[str] = None):
     """
     Context manager for database connections.
-    Uses config defaults if parameters not provided.
+    Uses config defaults if parameters not provided; in that case queries
+    run on the shared pool instead of a connection opened for this block.
     
     Args:
         host: Database host
@@ -249,6 +358,11 @@ async def get_db_connection(host: Optional[str] = None,
     Yields:
         DatabaseConnection instance
     """
+    if _is_default_target(host, port, user, password, database):
+        # The shared pool outlives this block
+        yield await _shared_pool_connection()
+        return
+
     conn = DatabaseConnection(host, port, user, password, database)
     try:
         await conn.connect()
@@ -267,7 +381,8 @@ async def get_db_pool(minsize: int = 1,
                      database: Optional[str] = None):
     """
     Context manager for database connection pool.
-    Uses config defaults if parameters not provided.
+    Uses config defaults if parameters not provided; in that case the
+    shared pool is yielded (and left open) and minsize/maxsize are ignored.
     
     Args:
         minsize: Minimum pool size
@@ -281,6 +396,10 @@ async def get_db_pool(minsize: int = 1,
     Yields:
         DatabaseConnection instance with pool
     """
+    if _is_default_target(host, port, user, password, database):
+        yield await _shared_pool_connection()
+        return
+
     conn = DatabaseConnection(host, port, user, password, database)
     try:
         await conn.create_pool(minsize, maxsize)
@@ -320,24 +439,57 @@ async def insert_record(
     """
     
     try:
-        cursor = None
-        if conn.pool:
-            async with conn.pool.acquire() as connection:
-                async with connection.cursor() as cursor:
-                    await cursor.execute(query, values)
-                    return cursor.lastrowid
-        elif conn.connection:
-            cursor = await conn.connection.cursor()
+        async with conn._cursor() as cursor:
             await cursor.execute(query, values)
             return cursor.lastrowid
-        else:
-            raise RuntimeError("No database connection available")
     except aiomysql.Error as e:
         logger.exception(f"Failed to insert into {table_name}")
         raise
-    finally:
-        if cursor and not conn.pool:
-            await cursor.close()
+
+
+async def insert_records(
+    conn: DatabaseConnection,
+    table_name: str,
+    rows: List[Dict[str, Any]]
+) -> int:
+    """
+    Insert several records into a table with one executemany call.
+    
+    Args:
+        conn: Database connection
+        table_name: Name of the table
+        rows: Records as dicts; all must have the same keys
+    
+    Returns:
+        Number of inserted rows
+    """
+    if not rows:
+        raise ValueError("Cannot insert empty record list")
+    
+    columns = list(rows[0].keys())
+    if not columns:
+        raise ValueError("Cannot insert empty record")
+    column_set = set(columns)
+    if any(row.keys() != column_set for row in rows):
+        raise ValueError("All records must have the same columns")
+    
+    placeholders = ', '.join(['%s'] * len(columns))
+    columns_str = ', '.join(f"`{col}`" for col in columns)
+    values = [tuple(row[col] for col in columns) for row in rows]
+    
+    query = f"""
+        INSERT INTO `{table_name}` ({columns_str})
+        VALUES ({placeholders})
+    """
+    
+    try:
+        # One cursor, and so one connection, for the whole batch
+        async with conn._cursor() as cursor:
+            await cursor.executemany(query, values)
+            return cursor.rowcount
+    except aiomysql.Error as e:
+        logger.exception(f"Failed to insert into {table_name}")
+        raise
 
 
 async def update_record(
@@ -425,19 +577,15 @@ async def table_exists(
     Returns:
         True if table exists, False otherwise
     """
-    query = """
-        SELECT COUNT(*)
-        FROM information_schema.tables
-        WHERE table_schema = %s
-        AND table_name = %s
-    """
+    # SHOW TABLES reads the table cache of the current database instead of
+    # scanning information_schema; escape LIKE wildcards so '_' is literal
+    query = "SHOW TABLES LIKE %s"
+    pattern = table_name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
     
     try:
-        result = await conn.fetch_one(
-            query, 
-            (conn.database, table_name)
-        )
-        return result['COUNT(*)'] > 0 if result else False
+        # The result column is named after the database, so only presence matters
+        result = await conn.fetch_one(query, (pattern,))
+        return result is not None
     except aiomysql.Error as e:
         logger.exception(f"Failed to check if table {table_name} exists")
         raise
\ No newline at end of file
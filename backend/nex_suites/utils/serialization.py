@@ -0,0 +1,40 @@
+"""JSON helpers for Nex Suites, using orjson when it is installed."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import PurePath
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def _default(obj: Any) -> Any:
+    """Convert objects neither encoder handles natively."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json", exclude_none=True)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, PurePath)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    def dumps(obj: Any, pretty: bool = False) -> str:
+        """Serialize ``obj`` to a compact JSON string, or indented when ``pretty``."""
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, default=_default, option=option).decode()
+
+    loads = orjson.loads
+else:
+    def dumps(obj: Any, pretty: bool = False) -> str:
+        """Serialize ``obj`` to a compact JSON string, or indented when ``pretty``."""
+        if pretty:
+            return json.dumps(obj, default=_default, ensure_ascii=False, indent=2)
+        return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":"))
+
+    loads = json.loads